@@ -14,14 +14,18 @@ def cli():
 
 
 @cli.command()
-@click.argument('directory', type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path))
+@click.argument('directory', type=click.Path(file_okay=False, dir_okay=True, path_type=Path))
 @click.option('--output', '-o', type=click.Path(path_type=Path), default='photo_database.json',
               help='Output JSON file path (default: photo_database.json)')
 @click.option('--recursive/--no-recursive', default=True,
               help='Scan directories recursively (default: True)')
+@click.option('--workers', type=click.IntRange(1, 64), default=1,
+              help='Number of scanner threads for the directory walk (default: 1)')
+@click.option('--metadata-cache/--no-metadata-cache', default=False,
+              help='Reuse EXIF results cached from earlier builds (default: False)')
 @click.option('--verbose', '-v', is_flag=True,
               help='Enable verbose logging')
-def build(directory: Path, output: Path, recursive: bool, verbose: bool):
+def build(directory: Path, output: Path, recursive: bool, workers: int, metadata_cache: bool, verbose: bool):
     """
     Build a photo group database from a directory.
     
@@ -37,7 +41,10 @@ def build(directory: Path, output: Path, recursive: bool, verbose: bool):
     try:
         # Build database using service
         database_service = DatabaseBuildService()
-        results = database_service.build_database(directory, output, recursive)
+        results = database_service.build_database(
+            directory, output, recursive, workers,
+            use_metadata_cache=metadata_cache
+        )
         
         # Show results
         PresentationService.show_build_results(results)
@@ -54,7 +61,7 @@ def build(directory: Path, output: Path, recursive: bool, verbose: bool):
 
 
 @cli.command()
-@click.argument('database', type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path))
+@click.argument('database', type=click.Path(file_okay=True, dir_okay=False, path_type=Path))
 @click.argument('destination', type=click.Path(file_okay=False, dir_okay=True, path_type=Path))
 @click.option('--scheme', '-s', required=True,
               help='Naming scheme with metadata placeholders (e.g., "{date}_{camera_model}_{basename}")')
@@ -153,7 +160,7 @@ def rename(database: Path, destination: Path, scheme: str, sequence_digits: int,
 
 
 @cli.command()
-@click.argument('root_folder', type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path))
+@click.argument('root_folder', type=click.Path(file_okay=False, dir_okay=True, path_type=Path))
 @click.option('--errors-only', is_flag=True, default=False,
               help='Only show groups with date mismatches (default: show all)')
 @click.option('--verbose', '-v', is_flag=True,
@@ -5,25 +5,115 @@ This module provides functionality to extract EXIF data from photos and
 parse XMP sidecar files to retrieve camera information and dates.
 """
 
+import atexit
 import logging
+import os
+import shutil
+import sqlite3
+import subprocess
+import threading
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, Optional, Any, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     import exifread
     from PIL import Image
-    from PIL.ExifTags import TAGS
     EXIF_AVAILABLE = True
 except ImportError:
     EXIF_AVAILABLE = False
     logging.warning("EXIF libraries not available. Install with: pip install exifread pillow")
 
+EXIFTOOL_AVAILABLE = shutil.which('exiftool') is not None
+
+
+def _json_loads(data):
+    """Deserialize JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to a compact JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+# EXIF lives at the front of JPEG (APP1 segment) and TIFF-based RAW (IFD0)
+# files, so parsing a bounded prefix avoids reading multi-megabyte images
+# just to pull a dozen tags. 128 KiB comfortably covers both layouts.
+_EXIF_PREFIX_BYTES = 128 * 1024
+
+# Containers Pillow can actually open for tag reading. RAW formats are
+# routed straight to exifread, skipping a PIL open that is guaranteed to
+# fail. HEIC stays in the PIL set so a registered plugin (pillow-heif)
+# is used when present; without one the open fails cheaply and the
+# exifread fallback runs as before.
+_PIL_FORMATS = frozenset({
+    '.jpg', '.jpeg', '.tif', '.tiff', '.png', '.webp',
+    '.heic', '.heif', '.hif'
+})
+
+
+# Clark-notation XMP element names mapped to the logical field they fill.
+# One walk over the tree with this table replaces a separate XPath scan
+# per field.
+_XMP_TAG_FIELDS = {
+    '{http://ns.adobe.com/tiff/1.0/}Make': 'make',
+    '{http://ns.adobe.com/tiff/1.0/}Model': 'model',
+    '{http://ns.adobe.com/exif/1.0/aux/}Lens': 'lens_model',
+    '{http://ns.adobe.com/exif/1.0/aux/}SerialNumber': 'serial_number',
+    '{http://ns.adobe.com/exif/1.0/}DateTimeOriginal': 'date_original',
+    '{http://ns.adobe.com/photoshop/1.0/}DateCreated': 'date_created',
+    '{http://ns.adobe.com/xap/1.0/}CreateDate': 'create_date',
+    '{http://ns.adobe.com/exif/1.0/}ISOSpeedRatings': 'iso',
+    '{http://ns.adobe.com/exif/1.0/}FNumber': 'aperture',
+    '{http://ns.adobe.com/exif/1.0/}ExposureTime': 'shutter_speed',
+    '{http://ns.adobe.com/exif/1.0/}FocalLength': 'focal_length',
+}
+
+
+def _parse_exif_datetime(value: str) -> Optional[datetime]:
+    """
+    Parse an EXIF "YYYY:MM:DD HH:MM:SS" timestamp.
 
-@dataclass
+    Digit slicing on the fixed-width layout is an order of magnitude
+    faster than strptime; strings that don't match the shape fall back
+    to strptime so unusual separators still parse.
+
+    Args:
+        value: The raw timestamp string (extra characters after the
+            19-byte core, e.g. subseconds or a zone, are ignored)
+
+    Returns:
+        datetime if the string parses, None otherwise
+    """
+    s = value[:19]
+    if len(s) == 19 and s[4] == ':' and s[7] == ':':
+        try:
+            return datetime(
+                int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                int(s[11:13]), int(s[14:16]), int(s[17:19])
+            )
+        except ValueError:
+            return None
+    try:
+        return datetime.strptime(s, "%Y:%m:%d %H:%M:%S")
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
 class CameraInfo:
     """Camera information extracted from metadata."""
     make: Optional[str] = None
@@ -33,14 +123,29 @@ class CameraInfo:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
-    
+        return {
+            'make': self.make,
+            'model': self.model,
+            'lens_model': self.lens_model,
+            'serial_number': self.serial_number
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CameraInfo':
+        """Create a CameraInfo from a dictionary."""
+        return cls(
+            make=data.get('make'),
+            model=data.get('model'),
+            lens_model=data.get('lens_model'),
+            serial_number=data.get('serial_number')
+        )
+
     def is_empty(self) -> bool:
         """Check if camera info is empty."""
-        return not any([self.make, self.model, self.lens_model, self.serial_number])
+        return not (self.make or self.model or self.lens_model or self.serial_number)
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraInfoWithSource:
     """Camera information with source file tracking."""
     make: Optional[str] = None
@@ -54,14 +159,23 @@ class CameraInfoWithSource:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
-    
+        return {
+            'make': self.make,
+            'make_source': self.make_source,
+            'model': self.model,
+            'model_source': self.model_source,
+            'lens_model': self.lens_model,
+            'lens_model_source': self.lens_model_source,
+            'serial_number': self.serial_number,
+            'serial_number_source': self.serial_number_source
+        }
+
     def is_empty(self) -> bool:
         """Check if camera info is empty."""
-        return not any([self.make, self.model, self.lens_model, self.serial_number])
+        return not (self.make or self.model or self.lens_model or self.serial_number)
 
 
-@dataclass
+@dataclass(slots=True)
 class DateInfo:
     """Date information extracted from metadata."""
     date_taken: Optional[datetime] = None
@@ -78,13 +192,25 @@ class DateInfo:
         if self.date_digitized:
             result['date_digitized'] = self.date_digitized.isoformat()
         return result
-    
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DateInfo':
+        """Create a DateInfo from a dictionary of ISO-format date strings."""
+        def _parse(value):
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            date_taken=_parse(data.get('date_taken')),
+            date_modified=_parse(data.get('date_modified')),
+            date_digitized=_parse(data.get('date_digitized'))
+        )
+
     def is_empty(self) -> bool:
         """Check if date info is empty."""
-        return not any([self.date_taken, self.date_modified, self.date_digitized])
+        return not (self.date_taken or self.date_modified or self.date_digitized)
 
 
-@dataclass
+@dataclass(slots=True)
 class DateInfoWithSource:
     """Date information with source file tracking."""
     date_taken: Optional[datetime] = None
@@ -113,10 +239,10 @@ class DateInfoWithSource:
     
     def is_empty(self) -> bool:
         """Check if date info is empty."""
-        return not any([self.date_taken, self.date_modified, self.date_digitized])
+        return not (self.date_taken or self.date_modified or self.date_digitized)
 
 
-@dataclass
+@dataclass(slots=True)
 class TechnicalInfo:
     """Technical camera settings extracted from metadata."""
     iso: Optional[int] = None
@@ -128,17 +254,35 @@ class TechnicalInfo:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
-    
+        return {
+            'iso': self.iso,
+            'aperture': self.aperture,
+            'shutter_speed': self.shutter_speed,
+            'focal_length': self.focal_length,
+            'focal_length_35mm': self.focal_length_35mm,
+            'flash_fired': self.flash_fired
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TechnicalInfo':
+        """Create a TechnicalInfo from a dictionary."""
+        return cls(
+            iso=data.get('iso'),
+            aperture=data.get('aperture'),
+            shutter_speed=data.get('shutter_speed'),
+            focal_length=data.get('focal_length'),
+            focal_length_35mm=data.get('focal_length_35mm'),
+            flash_fired=data.get('flash_fired')
+        )
+
     def is_empty(self) -> bool:
         """Check if technical info is empty."""
-        return not any([
-            self.iso, self.aperture, self.shutter_speed, 
-            self.focal_length, self.focal_length_35mm, self.flash_fired
-        ])
+        return not (self.iso or self.aperture or self.shutter_speed
+                    or self.focal_length or self.focal_length_35mm
+                    or self.flash_fired)
 
 
-@dataclass
+@dataclass(slots=True)
 class TechnicalInfoWithSource:
     """Technical camera settings with source file tracking."""
     iso: Optional[int] = None
@@ -156,17 +300,29 @@ class TechnicalInfoWithSource:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
-    
+        return {
+            'iso': self.iso,
+            'iso_source': self.iso_source,
+            'aperture': self.aperture,
+            'aperture_source': self.aperture_source,
+            'shutter_speed': self.shutter_speed,
+            'shutter_speed_source': self.shutter_speed_source,
+            'focal_length': self.focal_length,
+            'focal_length_source': self.focal_length_source,
+            'focal_length_35mm': self.focal_length_35mm,
+            'focal_length_35mm_source': self.focal_length_35mm_source,
+            'flash_fired': self.flash_fired,
+            'flash_fired_source': self.flash_fired_source
+        }
+
     def is_empty(self) -> bool:
         """Check if technical info is empty."""
-        return not any([
-            self.iso, self.aperture, self.shutter_speed, 
-            self.focal_length, self.focal_length_35mm, self.flash_fired
-        ])
+        return not (self.iso or self.aperture or self.shutter_speed
+                    or self.focal_length or self.focal_length_35mm
+                    or self.flash_fired)
 
 
-@dataclass
+@dataclass(slots=True)
 class PhotoMetadata:
     """Complete metadata for a photo."""
     camera: CameraInfo
@@ -182,13 +338,23 @@ class PhotoMetadata:
             'technical': self.technical.to_dict(),
             'source_file': self.source_file
         }
-    
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PhotoMetadata':
+        """Create a PhotoMetadata from a dictionary."""
+        return cls(
+            camera=CameraInfo.from_dict(data.get('camera', {})),
+            dates=DateInfo.from_dict(data.get('dates', {})),
+            technical=TechnicalInfo.from_dict(data.get('technical', {})),
+            source_file=data.get('source_file')
+        )
+
     def is_empty(self) -> bool:
         """Check if metadata is empty."""
         return self.camera.is_empty() and self.dates.is_empty() and self.technical.is_empty()
 
 
-@dataclass
+@dataclass(slots=True)
 class PhotoMetadataWithSource:
     """Complete metadata for a photo group with source file tracking."""
     camera: CameraInfoWithSource
@@ -210,51 +376,371 @@ class PhotoMetadataWithSource:
         return self.camera.is_empty() and self.dates.is_empty() and self.technical.is_empty()
 
 
+class MetadataCache:
+    """
+    Persistent cache of extracted photo metadata.
+
+    Entries are keyed by (absolute path, mtime_ns, size), so a file is only
+    re-parsed after it changes on disk. The cache is stored as a small
+    sqlite database, by default under ~/.cache/imgmaster/.
+    """
+
+    DEFAULT_PATH = Path.home() / '.cache' / 'imgmaster' / 'metadata.db'
+
+    def __init__(self, db_path: Optional[str | Path] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the sqlite file (defaults to ~/.cache/imgmaster/metadata.db)
+        """
+        self.logger = logging.getLogger(__name__)
+        path = Path(db_path) if db_path else self.DEFAULT_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # check_same_thread=False plus our own lock allows use from the
+        # extraction worker threads
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS metadata ('
+            '  path TEXT NOT NULL,'
+            '  mtime_ns INTEGER NOT NULL,'
+            '  size INTEGER NOT NULL,'
+            '  data TEXT NOT NULL,'
+            '  PRIMARY KEY (path, mtime_ns, size)'
+            ')'
+        )
+        self._pending_writes = 0
+
+    def get(self, path: str, mtime_ns: int, size: int) -> Optional[PhotoMetadata]:
+        """
+        Look up cached metadata for a file.
+
+        Args:
+            path: Absolute path of the photo file
+            mtime_ns: File modification time in nanoseconds
+            size: File size in bytes
+
+        Returns:
+            The cached PhotoMetadata, or None on a cache miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data FROM metadata WHERE path = ? AND mtime_ns = ? AND size = ?',
+                (path, mtime_ns, size)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        try:
+            return PhotoMetadata.from_dict(_json_loads(row[0]))
+        except (ValueError, KeyError) as e:
+            self.logger.debug("Discarding unreadable cache entry for %s: %s", path, e)
+            return None
+
+    def put(self, path: str, mtime_ns: int, size: int, metadata: PhotoMetadata) -> None:
+        """
+        Store metadata for a file, replacing any stale entry for the same path.
+
+        Args:
+            path: Absolute path of the photo file
+            mtime_ns: File modification time in nanoseconds
+            size: File size in bytes
+            metadata: The extracted metadata to cache
+        """
+        with self._lock:
+            # Drop entries for older versions of the same file
+            self._conn.execute('DELETE FROM metadata WHERE path = ?', (path,))
+            self._conn.execute(
+                'INSERT INTO metadata (path, mtime_ns, size, data) VALUES (?, ?, ?, ?)',
+                (path, mtime_ns, size, _json_dumps(metadata.to_dict()))
+            )
+
+            # Commit in batches to avoid per-file fsync overhead
+            self._pending_writes += 1
+            if self._pending_writes >= 256:
+                self._conn.commit()
+                self._pending_writes = 0
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+class ExifToolBatch:
+    """
+    Wrapper around a single long-lived ``exiftool -stay_open`` process.
+
+    Spawning exiftool per file is dominated by perl interpreter startup.
+    The -stay_open batch protocol keeps one process alive and feeds it
+    filenames over stdin, amortizing startup across the whole library.
+    Only the tags the extractor actually uses are requested.
+    """
+
+    # Restrict output to the fields PhotoMetadata stores
+    _TAG_ARGS = [
+        '-Make', '-Model', '-LensModel', '-SerialNumber',
+        '-DateTimeOriginal', '-ModifyDate', '-CreateDate',
+        '-ISO', '-FNumber', '-ExposureTime',
+        '-FocalLength', '-FocalLengthIn35mmFormat', '-Flash',
+    ]
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._process = subprocess.Popen(
+            ['exiftool', '-stay_open', 'True', '-@', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def extract(self, photo_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Extract the configured tags from a file via the batch process.
+
+        Args:
+            photo_path: Path to the photo file
+
+        Returns:
+            Dictionary of exiftool tag names to values, or None on failure
+        """
+        args = ['-j', '-n', '-fast2'] + self._TAG_ARGS + [str(photo_path)]
+
+        with self._lock:
+            if self._process.poll() is not None:
+                return None
+
+            self._process.stdin.write(
+                ('\n'.join(args) + '\n-execute\n').encode('utf-8')
+            )
+            self._process.stdin.flush()
+
+            # Read until the protocol's {ready} marker
+            output = bytearray()
+            while True:
+                line = self._process.stdout.readline()
+                if not line:
+                    return None
+                if line.startswith(b'{ready'):
+                    break
+                output.extend(line)
+
+        try:
+            result = _json_loads(bytes(output))
+            return result[0] if result else None
+        except (ValueError, IndexError) as e:
+            self.logger.debug("Unparseable exiftool output for %s: %s", photo_path, e)
+            return None
+
+    def close(self) -> None:
+        """Shut down the exiftool process."""
+        with self._lock:
+            if self._process.poll() is None:
+                try:
+                    self._process.stdin.write(b'-stay_open\nFalse\n')
+                    self._process.stdin.flush()
+                    self._process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    self._process.kill()
+
+
+# Shared batch process, started lazily on first use
+_exiftool_batch: Optional[ExifToolBatch] = None
+_exiftool_batch_lock = threading.Lock()
+
+
+def _get_exiftool_batch() -> Optional[ExifToolBatch]:
+    """Get the shared ExifToolBatch instance, starting it if needed."""
+    global _exiftool_batch
+    if not EXIFTOOL_AVAILABLE:
+        return None
+    with _exiftool_batch_lock:
+        if _exiftool_batch is None:
+            try:
+                _exiftool_batch = ExifToolBatch()
+            except OSError as e:
+                logging.getLogger(__name__).warning(f"Failed to start exiftool: {e}")
+                return None
+        return _exiftool_batch
+
+
+def _close_exiftool_batch() -> None:
+    """Shut down the shared exiftool process, if one was started."""
+    global _exiftool_batch
+    with _exiftool_batch_lock:
+        if _exiftool_batch is not None:
+            _exiftool_batch.close()
+            _exiftool_batch = None
+
+
+# Without this the -stay_open process outlives its pipe and has to notice
+# stdin closing on its own; shut it down cleanly at interpreter exit
+atexit.register(_close_exiftool_batch)
+
+
 class MetadataExtractor:
     """Extract metadata from photo files and sidecar files."""
-    
-    def __init__(self):
+
+    def __init__(self, cache: Optional[MetadataCache] = None):
         self.logger = logging.getLogger(__name__)
-        
+        self.cache = cache
+
     def extract_from_photo(self, photo_path: Path) -> PhotoMetadata:
         """
         Extract metadata from a photo file using EXIF data.
-        
+
         Args:
             photo_path: Path to the photo file
-            
+
         Returns:
             PhotoMetadata object with extracted information
         """
+        # Normalize the path to a string once; every downstream consumer
+        # (stat, open, cache key, source_file) wants the string form
+        path_str = os.fspath(photo_path)
+
+        # Check the persistent cache first, keyed by file identity
+        stat_result = None
+        if self.cache is not None:
+            try:
+                stat_result = os.stat(path_str)
+            except OSError:
+                stat_result = None
+            if stat_result is not None:
+                try:
+                    cached = self.cache.get(
+                        path_str, stat_result.st_mtime_ns, stat_result.st_size
+                    )
+                    if cached is not None:
+                        return cached
+                except (sqlite3.Error, OSError) as e:
+                    # A failed cache read (locked or corrupt database) just
+                    # means we extract normally, mirroring the put side
+                    self.logger.debug(
+                        "Failed to read cached metadata for %s: %s", path_str, e
+                    )
+
+        metadata = self._extract_uncached(photo_path)
+
+        # Only cache useful results; empty metadata is cheap to recompute
+        if stat_result is not None and not metadata.is_empty():
+            try:
+                self.cache.put(
+                    path_str, stat_result.st_mtime_ns, stat_result.st_size, metadata
+                )
+            except (sqlite3.Error, OSError) as e:
+                # A failed cache write (locked database, full disk) must not
+                # discard metadata we already extracted successfully
+                self.logger.debug("Failed to cache metadata for %s: %s", path_str, e)
+
+        return metadata
+
+    def _extract_uncached(self, photo_path: Path) -> PhotoMetadata:
+        """Extract metadata directly from the file, bypassing the cache."""
+        # Prefer the exiftool batch process when the binary is available
+        if EXIFTOOL_AVAILABLE:
+            metadata = self._extract_with_exiftool(photo_path)
+            if metadata is not None and not metadata.is_empty():
+                return metadata
+
         if not EXIF_AVAILABLE:
             self.logger.warning("EXIF libraries not available - cannot extract metadata")
-            return PhotoMetadata(
-                camera=CameraInfo(),
-                dates=DateInfo(),
-                technical=TechnicalInfo(),
-                source_file=str(photo_path)
-            )
-        
+            return self._empty_metadata(photo_path)
+
         try:
-            # Try PIL first (works well with JPEG, TIFF)
-            metadata = self._extract_with_pil(photo_path)
-            if not metadata.is_empty():
-                return metadata
-            
+            # Dispatch on suffix: PIL first for containers it can open
+            # (JPEG, TIFF, ...), straight to exifread for RAW formats
+            if photo_path.suffix.lower() in _PIL_FORMATS:
+                metadata = self._extract_with_pil(photo_path)
+                if not metadata.is_empty():
+                    return metadata
+
             # Fallback to exifread (works with RAW files)
             metadata = self._extract_with_exifread(photo_path)
             metadata.source_file = str(photo_path)
             return metadata
-            
+
         except Exception as e:
-            self.logger.warning(f"Failed to extract metadata from {photo_path}: {e}")
-            return PhotoMetadata(
-                camera=CameraInfo(),
-                dates=DateInfo(),
-                technical=TechnicalInfo(),
-                source_file=str(photo_path)
-            )
-    
+            self.logger.warning("Failed to extract metadata from %s: %s", photo_path, e)
+            return self._empty_metadata(photo_path)
+
+    @staticmethod
+    def _empty_metadata(photo_path: Path) -> PhotoMetadata:
+        """Build an empty PhotoMetadata for a file that yielded nothing."""
+        return PhotoMetadata(
+            camera=CameraInfo(),
+            dates=DateInfo(),
+            technical=TechnicalInfo(),
+            source_file=str(photo_path)
+        )
+
+    def _extract_with_exiftool(self, photo_path: Path) -> Optional[PhotoMetadata]:
+        """Extract metadata using the shared exiftool batch process."""
+        batch = _get_exiftool_batch()
+        if batch is None:
+            return None
+
+        tags = batch.extract(photo_path)
+        if tags is None:
+            return None
+
+        camera = CameraInfo()
+        dates = DateInfo()
+        technical = TechnicalInfo()
+
+        # Camera info
+        camera.make = tags.get('Make') or None
+        camera.model = tags.get('Model') or None
+        camera.lens_model = tags.get('LensModel') or None
+        serial = tags.get('SerialNumber')
+        camera.serial_number = str(serial) if serial is not None else None
+
+        # Date info
+        date_str = tags.get('DateTimeOriginal') or tags.get('CreateDate') or tags.get('ModifyDate')
+        if date_str:
+            # exiftool emits "YYYY:mm:dd HH:MM:SS" (possibly with subseconds/zone)
+            dates.date_taken = _parse_exif_datetime(str(date_str))
+
+        # Technical info (-n gives numeric values)
+        iso = tags.get('ISO')
+        if isinstance(iso, (int, float)):
+            technical.iso = int(iso)
+
+        fnumber = tags.get('FNumber')
+        if isinstance(fnumber, (int, float)):
+            technical.aperture = float(fnumber)
+
+        exposure = tags.get('ExposureTime')
+        if isinstance(exposure, (int, float)) and exposure > 0:
+            if exposure < 1:
+                technical.shutter_speed = f"1/{round(1 / exposure)}"
+            else:
+                technical.shutter_speed = str(exposure)
+
+        focal_len = tags.get('FocalLength')
+        if isinstance(focal_len, (int, float)):
+            technical.focal_length = float(focal_len)
+
+        focal_35mm = tags.get('FocalLengthIn35mmFormat')
+        if isinstance(focal_35mm, (int, float)):
+            technical.focal_length_35mm = int(focal_35mm)
+
+        flash_data = tags.get('Flash')
+        if isinstance(flash_data, int):
+            technical.flash_fired = bool(flash_data & 1)
+
+        return PhotoMetadata(
+            camera=camera,
+            dates=dates,
+            technical=technical,
+            source_file=str(photo_path)
+        )
+
     def _extract_with_pil(self, photo_path: Path) -> PhotoMetadata:
         """Extract metadata using PIL."""
         camera = CameraInfo()
@@ -263,45 +749,53 @@ class MetadataExtractor:
         
         try:
             with Image.open(photo_path) as img:
-                exif_data = img._getexif()
-                
+                # getexif() is the public API and caches the parsed block on
+                # the image, unlike the deprecated _getexif() which reparses
+                exif_data = img.getexif()
+
                 if exif_data:
+                    # Photo-specific tags live in the Exif sub-IFD
+                    exif_ifd = exif_data.get_ifd(0x8769)
+
                     # Camera info
                     camera.make = exif_data.get(271)  # Make
                     camera.model = exif_data.get(272)  # Model
-                    camera.lens_model = exif_data.get(42036)  # LensModel
-                    camera.serial_number = exif_data.get(42033)  # SerialNumber
-                    
+                    camera.lens_model = exif_ifd.get(42036)  # LensModel
+                    camera.serial_number = exif_ifd.get(42033)  # SerialNumber
+
                     # Date info
-                    date_str = exif_data.get(36868) or exif_data.get(306)  # DateTimeOriginal or DateTime
+                    date_str = exif_ifd.get(36868) or exif_data.get(306)  # DateTimeOriginal or DateTime
                     if date_str:
+                        dates.date_taken = _parse_exif_datetime(date_str)
+
+                    # Technical info
+                    technical.iso = exif_ifd.get(34855)  # ISOSpeedRatings
+
+                    # Aperture (IFDRational converts cleanly via float())
+                    fnumber = exif_ifd.get(33437)  # FNumber
+                    if fnumber is not None:
                         try:
-                            dates.date_taken = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-                        except ValueError:
+                            technical.aperture = float(fnumber)
+                        except (TypeError, ValueError, ZeroDivisionError):
                             pass
-                    
-                    # Technical info
-                    technical.iso = exif_data.get(34855)  # ISOSpeedRatings
-                    
-                    # Aperture
-                    fnumber = exif_data.get(33437)  # FNumber
-                    if fnumber and hasattr(fnumber, 'num') and hasattr(fnumber, 'den'):
-                        technical.aperture = float(fnumber.num) / float(fnumber.den)
-                    
+
                     # Focal length
-                    focal_len = exif_data.get(37386)  # FocalLength
-                    if focal_len and hasattr(focal_len, 'num') and hasattr(focal_len, 'den'):
-                        technical.focal_length = float(focal_len.num) / float(focal_len.den)
-                    
-                    technical.focal_length_35mm = exif_data.get(41989)  # FocalLengthIn35mmFilm
-                    
+                    focal_len = exif_ifd.get(37386)  # FocalLength
+                    if focal_len is not None:
+                        try:
+                            technical.focal_length = float(focal_len)
+                        except (TypeError, ValueError, ZeroDivisionError):
+                            pass
+
+                    technical.focal_length_35mm = exif_ifd.get(41989)  # FocalLengthIn35mmFilm
+
                     # Flash
-                    flash_data = exif_data.get(37385)  # Flash
+                    flash_data = exif_ifd.get(37385)  # Flash
                     if flash_data is not None:
                         technical.flash_fired = bool(flash_data & 1)
                         
         except Exception as e:
-            self.logger.debug(f"PIL extraction failed for {photo_path}: {e}")
+            self.logger.debug("PIL extraction failed for %s: %s", photo_path, e)
         
         return PhotoMetadata(
             camera=camera,
@@ -318,27 +812,48 @@ class MetadataExtractor:
         
         try:
             with open(photo_path, 'rb') as f:
-                tags = exifread.process_file(f, details=False)
-                
-                # Camera info
-                camera.make = str(tags.get('Image Make', '')).strip() or None
-                camera.model = str(tags.get('Image Model', '')).strip() or None
-                camera.lens_model = str(tags.get('EXIF LensModel', '')).strip() or None
-                camera.serial_number = str(tags.get('EXIF BodySerialNumber', '')).strip() or None
-                
+                # Parse only a prefix of the file; the tags we need sit near
+                # the start. Fall back to the whole file if the prefix holds
+                # nothing, in case the IFDs live beyond the slice.
+                # stop_tag aborts IFD processing after LensModel, the
+                # highest-numbered tag this method reads; thumbnails and
+                # MakerNote IFDs are never touched
+                prefix = f.read(_EXIF_PREFIX_BYTES)
+                tags = exifread.process_file(
+                    BytesIO(prefix), details=False,
+                    stop_tag='LensModel', extract_thumbnail=False
+                )
+                if not tags and len(prefix) == _EXIF_PREFIX_BYTES:
+                    f.seek(0)
+                    tags = exifread.process_file(
+                        f, details=False,
+                        stop_tag='LensModel', extract_thumbnail=False
+                    )
+
+                # Camera info; IfdTag.printable is the already-built string,
+                # so absent tags cost nothing and present ones skip str()
+                tag = tags.get('Image Make')
+                camera.make = (tag.printable.strip() or None) if tag else None
+                tag = tags.get('Image Model')
+                camera.model = (tag.printable.strip() or None) if tag else None
+                tag = tags.get('EXIF LensModel')
+                camera.lens_model = (tag.printable.strip() or None) if tag else None
+                tag = tags.get('EXIF BodySerialNumber')
+                camera.serial_number = (tag.printable.strip() or None) if tag else None
+
                 # Date info
-                date_str = str(tags.get('EXIF DateTimeOriginal', '')) or str(tags.get('Image DateTime', ''))
-                if date_str and date_str != '':
+                date_tag = tags.get('EXIF DateTimeOriginal') or tags.get('Image DateTime')
+                if date_tag is not None:
+                    dates.date_taken = _parse_exif_datetime(date_tag.printable)
+
+                # Technical info (values[0] is already numeric)
+                iso_tag = tags.get('EXIF ISOSpeedRatings')
+                if iso_tag is not None:
                     try:
-                        dates.date_taken = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-                    except ValueError:
+                        technical.iso = int(iso_tag.values[0])
+                    except (AttributeError, TypeError, ValueError, IndexError):
                         pass
                 
-                # Technical info
-                iso_str = str(tags.get('EXIF ISOSpeedRatings', ''))
-                if iso_str and iso_str.isdigit():
-                    technical.iso = int(iso_str)
-                
                 # Aperture
                 fnumber = tags.get('EXIF FNumber')
                 if fnumber:
@@ -349,8 +864,8 @@ class MetadataExtractor:
                 
                 # Shutter speed
                 exposure_time = tags.get('EXIF ExposureTime')
-                if exposure_time:
-                    technical.shutter_speed = str(exposure_time)
+                if exposure_time is not None:
+                    technical.shutter_speed = exposure_time.printable
                 
                 # Focal length
                 focal_len = tags.get('EXIF FocalLength')
@@ -370,7 +885,7 @@ class MetadataExtractor:
                         pass
                         
         except Exception as e:
-            self.logger.debug(f"exifread extraction failed for {photo_path}: {e}")
+            self.logger.debug("exifread extraction failed for %s: %s", photo_path, e)
         
         return PhotoMetadata(
             camera=camera,
@@ -394,71 +909,73 @@ class MetadataExtractor:
         technical = TechnicalInfo()
         
         try:
-            with open(xmp_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse XML
-            root = ET.fromstring(content)
-            
-            # Define namespaces
-            namespaces = {
-                'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
-                'exif': 'http://ns.adobe.com/exif/1.0/',
-                'tiff': 'http://ns.adobe.com/tiff/1.0/',
-                'xmp': 'http://ns.adobe.com/xap/1.0/',
-                'aux': 'http://ns.adobe.com/exif/1.0/aux/',
-                'photoshop': 'http://ns.adobe.com/photoshop/1.0/'
-            }
-            
+            # Feed the parser in chunks and stop as soon as every field of
+            # interest has been seen; Lightroom-style XMPs can carry
+            # megabytes of history steps after the attributes we care
+            # about, and this avoids holding the whole file in memory.
+            # The first occurrence of each tag wins, matching find()
+            # semantics.
+            values: Dict[str, Optional[str]] = {}
+            parser = ET.XMLPullParser(events=('end',))
+            with open(xmp_path, 'rb') as f:
+                complete = False
+                while not complete:
+                    chunk = f.read(65536)
+                    if not chunk:
+                        break
+                    parser.feed(chunk)
+                    for _event, elem in parser.read_events():
+                        field = _XMP_TAG_FIELDS.get(elem.tag)
+                        if field is not None and field not in values:
+                            values[field] = elem.text
+                            if len(values) == len(_XMP_TAG_FIELDS):
+                                complete = True
+                        elem.clear()
+
             # Extract camera info
-            camera.make = self._get_xmp_value(root, './/tiff:Make', namespaces)
-            camera.model = self._get_xmp_value(root, './/tiff:Model', namespaces)
-            camera.lens_model = self._get_xmp_value(root, './/aux:Lens', namespaces)
-            camera.serial_number = self._get_xmp_value(root, './/aux:SerialNumber', namespaces)
-            
-            # Extract date info - try multiple sources in priority order
-            date_str = self._get_xmp_value(root, './/exif:DateTimeOriginal', namespaces)
-            if not date_str:
-                # Fallback to photoshop:DateCreated (common in Adobe tools)
-                date_str = self._get_xmp_value(root, './/photoshop:DateCreated', namespaces)
-            if not date_str:
-                # Fallback to xmp:CreateDate
-                date_str = self._get_xmp_value(root, './/xmp:CreateDate', namespaces)
-            
+            camera.make = values.get('make')
+            camera.model = values.get('model')
+            camera.lens_model = values.get('lens_model')
+            camera.serial_number = values.get('serial_number')
+
+            # Extract date info - try multiple sources in priority order:
+            # exif:DateTimeOriginal, then photoshop:DateCreated (common in
+            # Adobe tools), then xmp:CreateDate
+            date_str = (values.get('date_original')
+                        or values.get('date_created')
+                        or values.get('create_date'))
+
             if date_str:
                 try:
                     # XMP dates are usually in ISO format
                     dates.date_taken = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
                 except ValueError:
-                    try:
-                        # Try EXIF format
-                        dates.date_taken = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-                    except ValueError:
-                        pass
+                    # Try EXIF format
+                    dates.date_taken = _parse_exif_datetime(date_str)
             
             # Extract technical info
-            iso_str = self._get_xmp_value(root, './/exif:ISOSpeedRatings', namespaces)
+            iso_str = values.get('iso')
             if iso_str and iso_str.isdigit():
                 technical.iso = int(iso_str)
-            
-            aperture_str = self._get_xmp_value(root, './/exif:FNumber', namespaces)
+
+            aperture_str = values.get('aperture')
             if aperture_str:
                 try:
                     technical.aperture = float(aperture_str)
                 except ValueError:
                     pass
-            
-            technical.shutter_speed = self._get_xmp_value(root, './/exif:ExposureTime', namespaces)
-            
-            focal_len_str = self._get_xmp_value(root, './/exif:FocalLength', namespaces)
+
+            technical.shutter_speed = values.get('shutter_speed')
+
+            focal_len_str = values.get('focal_length')
             if focal_len_str:
                 try:
                     technical.focal_length = float(focal_len_str)
                 except ValueError:
                     pass
-                    
+
         except Exception as e:
-            self.logger.warning(f"Failed to extract XMP metadata from {xmp_path}: {e}")
+            self.logger.warning("Failed to extract XMP metadata from %s: %s", xmp_path, e)
         
         return PhotoMetadata(
             camera=camera,
@@ -467,12 +984,3 @@ class MetadataExtractor:
             source_file=str(xmp_path)
         )
     
-    def _get_xmp_value(self, root: ET.Element, xpath: str, namespaces: Dict[str, str]) -> Optional[str]:
-        """Extract a value from XMP using XPath."""
-        try:
-            element = root.find(xpath, namespaces)
-            if element is not None:
-                return element.text
-        except Exception:
-            pass
-        return None
@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -10,7 +11,14 @@ class Photo:
     This model stores essential file information including the absolute path,
     basename, and extension for easy access and manipulation.
     """
-    
+
+    # One Photo exists per file on disk, so fixed slots instead of a per-
+    # instance __dict__ saves a few hundred bytes each across large libraries
+    __slots__ = (
+        'absolute_path', 'basename', 'extension', 'filename',
+        'format_classification', 'history', '_mtime', '_size'
+    )
+
     # JPEG formats
     JPEG_FORMATS = {'.jpg', '.jpeg'}
     
@@ -137,10 +145,15 @@ class Photo:
         
         # Store the absolute path
         self.absolute_path = path_obj.resolve()
-        
-        # Verify the file exists
-        if not self.absolute_path.exists():
-            raise FileNotFoundError(f"Photo file not found: {self.absolute_path}")
+
+        # Verify the file exists; the same stat call doubles as the source of
+        # the cached mtime/size so later lookups don't hit the filesystem again
+        try:
+            stat_result = os.stat(self.absolute_path)
+        except OSError:
+            raise FileNotFoundError(f"Photo file not found: {self.absolute_path}") from None
+        self._mtime = stat_result.st_mtime
+        self._size = stat_result.st_size
         
         # Store basename (filename without extension)
         self.basename = self.absolute_path.stem
@@ -149,8 +162,9 @@ class Photo:
         if self.absolute_path.suffix.lower() == '.aae':
             self.basename = self._normalize_aae_basename(self.basename)
         
-        # Store extension (including the dot)
-        self.extension = self.absolute_path.suffix.lower()
+        # Store extension (including the dot). Extensions come from a tiny
+        # vocabulary, so interning lets dict lookups use identity comparison.
+        self.extension = sys.intern(self.absolute_path.suffix.lower())
         
         # Store the full filename
         self.filename = self.absolute_path.name
@@ -234,10 +248,15 @@ class Photo:
         """Check if the photo is another standard format (PNG, GIF, etc.)."""
         return self.extension in self.OTHER_PHOTO_FORMATS
     
+    @property
+    def mtime(self) -> float:
+        """Get the file modification time captured when the Photo was created."""
+        return self._mtime
+
     @property
     def size_bytes(self) -> int:
-        """Get the file size in bytes."""
-        return self.absolute_path.stat().st_size
+        """Get the file size in bytes, captured when the Photo was created."""
+        return self._size
     
     @property
     def size_mb(self) -> float:
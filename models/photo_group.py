@@ -1,6 +1,16 @@
 import json
 import logging
-from typing import Dict, List, Set, Optional
+import os
+import queue
+import stat
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Set, Optional, Tuple
 from collections import defaultdict
 from pathlib import Path
 
@@ -13,6 +23,195 @@ from .metadata import (
 )
 
 
+def _json_dumps(obj, indent: int = 2) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    return json.dumps(obj, indent=indent if indent else None, ensure_ascii=False)
+
+
+def _json_loads(data: bytes | str):
+    """Deserialize JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Extensions whose containers can actually carry EXIF-style metadata.
+# Live Photo .mov clips and vector/icon formats never do, so attempting
+# extraction on them only burns a failed parse per file.
+_EXIF_CAPABLE_EXTS = frozenset(
+    Photo.JPEG_FORMATS | Photo.RAW_FORMATS | Photo.HEIC_FORMATS
+    | {'.png', '.tiff', '.tif', '.webp'}
+)
+
+
+def fast_walk(
+    root: str | Path,
+    recursive: bool = True,
+    extensions: Optional[Set[str]] = None
+) -> Iterator[Tuple[str, str]]:
+    """
+    Walk a directory tree using os.scandir, yielding (path, name) for each file.
+
+    This is significantly faster than Path.glob/os.walk on large trees because
+    DirEntry caches the file type returned by the OS directory read, avoiding
+    an extra stat syscall per entry. When an extension filter is given,
+    non-matching files are skipped before any further object construction.
+
+    Args:
+        root: The directory to walk
+        recursive: Whether to descend into subdirectories
+        extensions: Optional set of lowercase extensions (with leading dot)
+            to filter on; files with other extensions are skipped
+
+    Yields:
+        Tuples of (absolute file path, file name)
+
+    Raises:
+        FileNotFoundError: If root doesn't exist
+        NotADirectoryError: If root is not a directory
+    """
+    root_path = os.fspath(root)
+
+    if recursive and hasattr(os, 'fwalk'):
+        # POSIX: fwalk keeps a directory fd open per level, letting the kernel
+        # resolve entries relative to it instead of re-walking absolute paths.
+        # Validate the root eagerly so errors propagate; unreadable
+        # subdirectories are silently skipped, matching the scandir branch.
+        with os.scandir(root_path):
+            pass
+        for dirpath, _dirnames, filenames, dirfd in os.fwalk(
+            root_path, follow_symlinks=False
+        ):
+            for name in filenames:
+                if extensions is not None:
+                    dot = name.rfind('.')
+                    ext = name[dot:].lower() if dot >= 0 else ''
+                    if ext not in extensions:
+                        continue
+                # fwalk lists symlinks among filenames; skip anything that is
+                # not a regular file so all walker branches agree
+                try:
+                    if not stat.S_ISREG(os.lstat(name, dir_fd=dirfd).st_mode):
+                        continue
+                except OSError:
+                    continue
+                yield os.path.join(dirpath, name), name
+        return
+
+    stack = [root_path]
+
+    while stack:
+        current = stack.pop()
+        try:
+            scandir_it = os.scandir(current)
+        except OSError:
+            # Propagate errors for the root directory, skip unreadable subdirs
+            if current == root_path:
+                raise
+            continue
+
+        with scandir_it:
+            for entry in scandir_it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        if extensions is not None:
+                            name = entry.name
+                            dot = name.rfind('.')
+                            ext = name[dot:].lower() if dot >= 0 else ''
+                            if ext not in extensions:
+                                continue
+                        yield entry.path, entry.name
+                except OSError:
+                    continue
+
+
+def fast_walk_parallel(
+    root: str | Path,
+    extensions: Optional[Set[str]] = None,
+    max_workers: int = 8
+) -> Iterator[Tuple[str, str]]:
+    """
+    Walk a directory tree with a pool of scandir workers, yielding (path, name).
+
+    Independent subdirectories are scanned concurrently, which hides per-call
+    syscall latency on slow or network-mounted filesystems. os.scandir and
+    stat release the GIL, so threads scale here. File ordering is not
+    deterministic; callers that need ordering should sort afterwards.
+
+    Args:
+        root: The directory to walk (always recursive)
+        extensions: Optional set of lowercase extensions (with leading dot)
+            to filter on; files with other extensions are skipped
+        max_workers: Number of scanner threads
+
+    Yields:
+        Tuples of (absolute file path, file name)
+
+    Raises:
+        FileNotFoundError: If root doesn't exist
+        NotADirectoryError: If root is not a directory
+    """
+    root_path = os.fspath(root)
+    # Validate the root up front so errors surface in the caller's thread
+    with os.scandir(root_path):
+        pass
+
+    results: queue.Queue = queue.Queue()
+    done_sentinel = object()
+    lock = threading.Lock()
+    outstanding = 0
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(path: str) -> None:
+        nonlocal outstanding
+        with lock:
+            outstanding += 1
+        executor.submit(scan, path)
+
+    def scan(path: str) -> None:
+        nonlocal outstanding
+        try:
+            with os.scandir(path) as scandir_it:
+                for entry in scandir_it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            submit(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            if extensions is not None:
+                                name = entry.name
+                                dot = name.rfind('.')
+                                ext = name[dot:].lower() if dot >= 0 else ''
+                                if ext not in extensions:
+                                    continue
+                            results.put((entry.path, entry.name))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        finally:
+            with lock:
+                outstanding -= 1
+                if outstanding == 0:
+                    results.put(done_sentinel)
+
+    submit(root_path)
+    try:
+        while True:
+            item = results.get()
+            if item is done_sentinel:
+                break
+            yield item
+    finally:
+        executor.shutdown(wait=True)
+
+
 class PhotoGroup:
     """
     A group of photos that share the same base filename.
@@ -20,7 +219,9 @@ class PhotoGroup:
     This class manages collections of related files (e.g., RAW + JPEG, sidecar files)
     that have the same basename but different extensions.
     """
-    
+
+    __slots__ = ('basename', '_photos', '_metadata_cache', '_metadata_extractor')
+
     def __init__(self, basename: str):
         """
         Initialize a PhotoGroup with a given basename.
@@ -233,9 +434,11 @@ class PhotoGroup:
         aggregated_dates = DateInfoWithSource()
         aggregated_technical = TechnicalInfoWithSource()
         
-        # Get photos that can contain metadata (prioritize non-sidecar files)
-        photo_files = [photo for photo in self._photos.values() 
-                      if photo.format_classification not in ['sidecar']]
+        # Get photos that can contain metadata; extensions outside
+        # _EXIF_CAPABLE_EXTS (live-photo clips, icons, vectors) are skipped
+        # up front rather than failing extraction one by one
+        photo_files = [photo for photo in self._photos.values()
+                       if photo.extension in _EXIF_CAPABLE_EXTS]
         
         # Also check for sidecar files that might contain metadata
         sidecar_files = [photo for photo in self._photos.values() 
@@ -250,7 +453,7 @@ class PhotoGroup:
                 if not metadata.is_empty():
                     metadata_sources.append((metadata, str(photo.filename), 'photo'))
             except Exception as e:
-                logger.debug(f"Failed to extract metadata from {photo.absolute_path}: {e}")
+                logger.debug("Failed to extract metadata from %s: %s", photo.absolute_path, e)
         
         # Extract metadata from sidecar files (lower priority)
         for sidecar in sidecar_files:
@@ -260,7 +463,7 @@ class PhotoGroup:
                     if not metadata.is_empty():
                         metadata_sources.append((metadata, str(sidecar.filename), 'sidecar'))
             except Exception as e:
-                logger.debug(f"Failed to extract metadata from {sidecar.absolute_path}: {e}")
+                logger.debug("Failed to extract metadata from %s: %s", sidecar.absolute_path, e)
         
         # Aggregate metadata from all sources with priority
         if metadata_sources:
@@ -529,26 +732,54 @@ class PhotoGroupManager:
         
         return len(invalid_basenames)
 
-    def extract_all_metadata(self, force_refresh: bool = False) -> None:
+    def set_metadata_cache(self, cache) -> None:
+        """
+        Attach a persistent MetadataCache to every group's extractor.
+
+        Args:
+            cache: A MetadataCache instance, or None to disable caching
+        """
+        for group in self._groups.values():
+            group._metadata_extractor.cache = cache
+
+    def extract_all_metadata(self, force_refresh: bool = False, workers: int = 1) -> None:
         """
         Extract metadata for all groups in the manager.
-        
+
         Args:
             force_refresh: If True, re-extract metadata even if cached
+            workers: Number of extraction threads (1 = sequential)
         """
         logger = logging.getLogger(__name__)
         logger.info("Extracting metadata for all photo groups...")
-        
+
         total_groups = len(self._groups)
         processed = 0
-        
-        for group in self._groups.values():
-            group.extract_metadata(force_refresh=force_refresh)
-            processed += 1
-            
-            if processed % 10 == 0:  # Log progress every 10 groups
-                logger.info(f"Extracted metadata for {processed}/{total_groups} groups")
-        
+
+        if workers > 1 and total_groups > 1:
+            # Each group has its own extractor and only mutates itself, so
+            # groups can be processed concurrently. Threads suffice: the work
+            # is dominated by file reads and the EXIF parsers release the GIL
+            # during I/O.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(group.extract_metadata, force_refresh=force_refresh)
+                    for group in self._groups.values()
+                ]
+                for future in as_completed(futures):
+                    future.result()  # Propagate any extraction errors
+                    processed += 1
+
+                    if processed % 10 == 0:  # Log progress every 10 groups
+                        logger.info("Extracted metadata for %d/%d groups", processed, total_groups)
+        else:
+            for group in self._groups.values():
+                group.extract_metadata(force_refresh=force_refresh)
+                processed += 1
+
+                if processed % 10 == 0:  # Log progress every 10 groups
+                    logger.info("Extracted metadata for %d/%d groups", processed, total_groups)
+
         logger.info(f"Metadata extraction completed for {processed} groups")
     
     @property
@@ -595,14 +826,20 @@ class PhotoGroupManager:
         """Detailed string representation of the PhotoGroupManager."""
         return f"PhotoGroupManager(groups={list(self._groups.keys())})"
     
-    def scan_directory(self, directory_path: str | Path, recursive: bool = True) -> int:
+    def scan_directory(
+        self,
+        directory_path: str | Path,
+        recursive: bool = True,
+        workers: int = 1
+    ) -> int:
         """
         Scan a directory for photo files and add them to groups.
-        
+
         Args:
             directory_path: Path to the directory to scan
             recursive: Whether to scan subdirectories recursively
-            
+            workers: Number of scanner threads (only used for recursive scans)
+
         Returns:
             The number of photos found and added
             
@@ -612,43 +849,42 @@ class PhotoGroupManager:
         """
         logger = logging.getLogger(__name__)
         directory = Path(directory_path)
-        
-        if not directory.exists():
-            raise FileNotFoundError(f"Directory not found: {directory}")
-        
-        if not directory.is_dir():
-            raise ValueError(f"Path is not a directory: {directory}")
-        
+
         logger.info(f"Starting scan of directory: {directory}")
         logger.info(f"Recursive scan: {recursive}")
         
         photos_found = 0
         errors_encountered = 0
         supported_formats = Photo.get_all_supported_formats()
-        
-        # Choose the appropriate glob pattern
-        pattern = "**/*" if recursive else "*"
-        
-        for file_path in directory.glob(pattern):
-            if not file_path.is_file():
-                continue
-            
-            # Check if the file extension is supported
-            file_extension = file_path.suffix.lower()
-            if file_extension not in supported_formats:
-                continue
-            
-            try:
-                photo = Photo(file_path)
-                self.add_photo(photo)
-                photos_found += 1
-                
-                if photos_found % 100 == 0:  # Log progress every 100 files
-                    logger.info(f"Processed {photos_found} photos so far...")
-                    
-            except Exception as e:
-                errors_encountered += 1
-                logger.warning(f"Failed to process file {file_path}: {e}")
+
+        if workers > 1 and recursive:
+            walker = fast_walk_parallel(
+                directory, extensions=supported_formats, max_workers=workers
+            )
+        else:
+            walker = fast_walk(
+                directory, recursive=recursive, extensions=supported_formats
+            )
+
+        # The walkers validate the root on their first directory read, so no
+        # separate exists/is_dir stat pair is needed up front
+        try:
+            for file_path, file_name in walker:
+                try:
+                    photo = Photo(file_path)
+                    self.add_photo(photo)
+                    photos_found += 1
+
+                    if photos_found % 100 == 0:  # Log progress every 100 files
+                        logger.info("Processed %d photos so far...", photos_found)
+
+                except Exception as e:
+                    errors_encountered += 1
+                    logger.warning("Failed to process file %s: %s", file_path, e)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Directory not found: {directory}") from None
+        except NotADirectoryError:
+            raise ValueError(f"Path is not a directory: {directory}") from None
         
         logger.info(f"Scan completed. Found {photos_found} photos in {self.total_groups} groups")
         if errors_encountered > 0:
@@ -656,93 +892,112 @@ class PhotoGroupManager:
         
         return photos_found
     
+    def _metadata_to_dict(self) -> Dict:
+        """Build the top-level metadata section for serialization."""
+        return {
+            "total_groups": self.total_groups,
+            "total_valid_groups": self.total_valid_groups,
+            "total_invalid_groups": self.total_invalid_groups,
+            "total_photos": self.total_photos,
+            "created_by": "imgmaster",
+            "version": "1.0"
+        }
+
+    def _group_to_dict(self, group: PhotoGroup) -> Dict:
+        """Convert a single PhotoGroup to a dictionary for JSON serialization."""
+        # Extract metadata for this group
+        group_metadata = group.extract_metadata()
+
+        group_data = {
+            "basename": group.basename,
+            "count": group.count,
+            "is_valid": group.is_valid,
+            "has_only_supplementary_files": group.has_only_supplementary_files,
+            "formats": {
+                "jpeg": group.has_jpeg,
+                "raw": group.has_raw,
+                "heic": group.has_heic,
+                "live_photo": group.has_live_photo,
+                "sidecar": group.has_sidecar,
+                "other": group.is_other_format
+            },
+            "metadata": group_metadata.to_dict(),
+            "photos": []
+        }
+
+        for photo in group.get_photos():
+            photo_data = {
+                "filename": photo.filename,
+                "basename": photo.basename,
+                "extension": photo.extension,
+                "absolute_path": str(photo.absolute_path),
+                "format_classification": photo.format_classification,
+                "size_bytes": photo.size_bytes,
+                "size_mb": photo.size_mb,
+                "history": getattr(photo, 'history', [])
+            }
+            group_data["photos"].append(photo_data)
+
+        return group_data
+
     def to_dict(self) -> Dict:
         """
         Convert the PhotoGroupManager to a dictionary for JSON serialization.
-        
+
         Returns:
             A dictionary representation of all groups and photos
         """
-        result = {
-            "metadata": {
-                "total_groups": self.total_groups,
-                "total_valid_groups": self.total_valid_groups,
-                "total_invalid_groups": self.total_invalid_groups,
-                "total_photos": self.total_photos,
-                "created_by": "imgmaster",
-                "version": "1.0"
-            },
-            "groups": {}
-        }
-        
-        for basename, group in self._groups.items():
-            # Extract metadata for this group
-            group_metadata = group.extract_metadata()
-            
-            group_data = {
-                "basename": group.basename,
-                "count": group.count,
-                "is_valid": group.is_valid,
-                "has_only_supplementary_files": group.has_only_supplementary_files,
-                "formats": {
-                    "jpeg": group.has_jpeg,
-                    "raw": group.has_raw,
-                    "heic": group.has_heic,
-                    "live_photo": group.has_live_photo,
-                    "sidecar": group.has_sidecar,
-                    "other": group.is_other_format
-                },
-                "metadata": group_metadata.to_dict(),
-                "photos": []
+        return {
+            "metadata": self._metadata_to_dict(),
+            "groups": {
+                basename: self._group_to_dict(group)
+                for basename, group in self._groups.items()
             }
-            
-            for photo in group.get_photos():
-                photo_data = {
-                    "filename": photo.filename,
-                    "basename": photo.basename,
-                    "extension": photo.extension,
-                    "absolute_path": str(photo.absolute_path),
-                    "format_classification": photo.format_classification,
-                    "size_bytes": photo.size_bytes,
-                    "size_mb": photo.size_mb,
-                    "history": getattr(photo, 'history', [])
-                }
-                group_data["photos"].append(photo_data)
-            
-            result["groups"][basename] = group_data
-        
-        return result
-    
+        }
+
     def save_to_json(self, file_path: str | Path, indent: int = 2) -> None:
         """
         Save the PhotoGroupManager to a JSON file.
-        
+
+        Groups are serialized and written one at a time, so peak memory stays
+        proportional to the largest group rather than the whole database.
+
         Args:
             file_path: Path where to save the JSON file
             indent: Number of spaces for JSON indentation
-            
+
         Raises:
             PermissionError: If the file cannot be written
             OSError: If there's an I/O error
         """
         logger = logging.getLogger(__name__)
         output_path = Path(file_path)
-        
+
         logger.info(f"Saving photo database to: {output_path}")
-        
+
         try:
             # Ensure the directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            data = self.to_dict()
-            
+
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False)
-            
+                f.write('{\n"metadata": ')
+                f.write(_json_dumps(self._metadata_to_dict(), indent=indent))
+                f.write(',\n"groups": {')
+                first = True
+                for basename, group in self._groups.items():
+                    if not first:
+                        f.write(',')
+                    first = False
+                    f.write('\n')
+                    f.write(_json_dumps(basename, indent=0))
+                    f.write(': ')
+                    f.write(_json_dumps(self._group_to_dict(group), indent=indent))
+                f.write('\n}}\n')
+
             file_size = output_path.stat().st_size
             logger.info(f"Successfully saved database with {self.total_groups} groups and {self.total_photos} photos")
             logger.info(f"Output file size: {file_size:,} bytes ({file_size / 1024:.1f} KB)")
-            
+
         except Exception as e:
             logger.error(f"Failed to save database to {output_path}: {e}")
             raise
@@ -771,7 +1026,7 @@ class PhotoGroupManager:
         
         for basename, group_data in data["groups"].items():
             if "photos" not in group_data:
-                logger.warning(f"Skipping group {basename}: missing photos data")
+                logger.warning("Skipping group %s: missing photos data", basename)
                 continue
             
             for photo_data in group_data["photos"]:
@@ -785,9 +1040,9 @@ class PhotoGroupManager:
                             photo.history = photo_data["history"]
                         manager.add_photo(photo)
                     else:
-                        logger.warning(f"Photo file not found: {photo_path}")
+                        logger.warning("Photo file not found: %s", photo_path)
                 except Exception as e:
-                    logger.warning(f"Failed to recreate photo from data: {e}")
+                    logger.warning("Failed to recreate photo from data: %s", e)
         
         logger.info(f"Loaded {manager.total_groups} groups with {manager.total_photos} photos from saved data")
         return manager
@@ -813,17 +1068,16 @@ class PhotoGroupManager:
         
         logger.info(f"Loading photo database from: {input_path}")
         
-        if not input_path.exists():
-            raise FileNotFoundError(f"Database file not found: {input_path}")
-        
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            # Let the open itself detect a missing file rather than stat'ing first
+            data = _json_loads(input_path.read_bytes())
+
             manager = cls.from_dict(data)
             logger.info(f"Successfully loaded database from {input_path}")
             return manager
-            
+
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Database file not found: {input_path}") from None
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in file {input_path}: {e}")
             raise
@@ -1,10 +1,12 @@
 """Database building service for photo group management."""
 
 import logging
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Any
 
 from models import PhotoGroupManager
+from models.metadata import MetadataCache
 
 
 class DatabaseBuildService:
@@ -14,19 +16,23 @@ class DatabaseBuildService:
         self.logger = logging.getLogger(__name__)
     
     def build_database(
-        self, 
-        directory: Path, 
-        output: Path, 
-        recursive: bool = True
+        self,
+        directory: Path,
+        output: Path,
+        recursive: bool = True,
+        workers: int = 1,
+        use_metadata_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Build a photo group database from a directory.
-        
+
         Args:
             directory: Source directory to scan
             output: Output JSON file path
             recursive: Whether to scan recursively
-            
+            workers: Number of scanner threads for the directory walk
+            use_metadata_cache: Whether to reuse EXIF results cached from earlier builds
+
         Returns:
             Dictionary with build results and statistics
             
@@ -42,7 +48,7 @@ class DatabaseBuildService:
         
         # Initialize manager and scan directory
         manager = PhotoGroupManager()
-        manager.scan_directory(directory, recursive=recursive)
+        manager.scan_directory(directory, recursive=recursive, workers=workers)
         
         # Check if any photos were found
         if manager.total_photos == 0:
@@ -64,7 +70,16 @@ class DatabaseBuildService:
         
         # Extract metadata for all groups
         self.logger.info("Extracting metadata for all photo groups...")
-        manager.extract_all_metadata()
+        cache = None
+        if use_metadata_cache:
+            cache = MetadataCache()
+            manager.set_metadata_cache(cache)
+        try:
+            manager.extract_all_metadata(workers=workers)
+        finally:
+            if cache is not None:
+                manager.set_metadata_cache(None)
+                cache.close()
         
         # Save to JSON
         self.logger.info(f"Saving photo database to: {output}")
@@ -75,38 +90,44 @@ class DatabaseBuildService:
     
     def _build_statistics(self, manager: PhotoGroupManager) -> Dict[str, Any]:
         """Build statistics about the scanned photos."""
-        # Get format breakdown
-        format_breakdown = {}
+        # Accumulate everything in a single pass over the groups instead of
+        # taking separate walks for format stats, invalid groups and
+        # multi-format groups (each of which re-sorted extensions per group)
+        format_breakdown = Counter()
+        total_photos = 0
+        invalid_count = 0
+        multi_format_count = 0
+        invalid_preview = []
+        multi_format_preview = []
+
         for group in manager.get_all_groups():
-            for photo in group.get_photos():
-                format_type = photo.format_classification
-                format_breakdown[format_type] = format_breakdown.get(format_type, 0) + 1
-        
-        # Get groups with multiple formats
-        multi_format_groups = manager.get_groups_with_multiple_formats()
-        
-        # Get invalid groups
-        invalid_groups = manager.get_invalid_groups()
-        
+            photos = group.get_photos()
+            total_photos += len(photos)
+            format_breakdown.update(photo.format_classification for photo in photos)
+
+            if len(photos) > 1:
+                multi_format_count += 1
+                if len(multi_format_preview) < 5:  # Limit to first 5
+                    multi_format_preview.append({
+                        'basename': group.basename,
+                        'extensions': sorted(group.get_extensions())
+                    })
+
+            if not group.is_valid:
+                invalid_count += 1
+                if len(invalid_preview) < 5:  # Limit to first 5
+                    invalid_preview.append({
+                        'basename': group.basename,
+                        'extensions': sorted(group.get_extensions())
+                    })
+
         return {
-            'total_photos': manager.total_photos,
+            'total_photos': total_photos,
             'total_groups': manager.total_groups,
-            'valid_groups': manager.total_valid_groups,
-            'invalid_groups': manager.total_invalid_groups,
-            'format_breakdown': format_breakdown,
-            'multi_format_groups': [
-                {
-                    'basename': group.basename,
-                    'extensions': sorted(group.get_extensions())
-                }
-                for group in multi_format_groups[:5]  # Limit to first 5
-            ],
-            'multi_format_groups_total': len(multi_format_groups),
-            'invalid_groups_list': [
-                {
-                    'basename': group.basename,
-                    'extensions': sorted(group.get_extensions())
-                }
-                for group in invalid_groups[:5]  # Limit to first 5
-            ]
+            'valid_groups': manager.total_groups - invalid_count,
+            'invalid_groups': invalid_count,
+            'format_breakdown': dict(format_breakdown),
+            'multi_format_groups': multi_format_preview,
+            'multi_format_groups_total': multi_format_count,
+            'invalid_groups_list': invalid_preview
         }
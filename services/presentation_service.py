@@ -20,30 +20,38 @@ class PresentationService:
         
         # Show invalid groups if any
         if results['invalid_groups'] > 0:
-            click.echo(f"Invalid groups (sidecar/live photos only): {results['invalid_groups']}")
-            click.echo("Invalid groups:")
+            # Build the listing in memory and emit it with one echo so each
+            # line doesn't pay for a separate write
+            lines = [
+                f"Invalid groups (sidecar/live photos only): {results['invalid_groups']}",
+                "Invalid groups:"
+            ]
             for group in results['invalid_groups_list']:
                 extensions = ', '.join(group['extensions'])
-                click.echo(f"  {group['basename']}: {extensions}")
+                lines.append(f"  {group['basename']}: {extensions}")
             if len(results['invalid_groups_list']) < results['invalid_groups']:
                 remaining = results['invalid_groups'] - len(results['invalid_groups_list'])
-                click.echo(f"  ... and {remaining} more invalid groups")
-        
+                lines.append(f"  ... and {remaining} more invalid groups")
+            click.echo('\n'.join(lines))
+
         # Show format breakdown
         if results['format_breakdown']:
-            click.echo(f"\nFormat breakdown:")
-            for format_type, count in results['format_breakdown'].items():
-                click.echo(f"  {format_type}: {count} files")
-        
+            click.echo('\n'.join(
+                ["\nFormat breakdown:"] +
+                [f"  {format_type}: {count} files"
+                 for format_type, count in results['format_breakdown'].items()]
+            ))
+
         # Show groups with multiple formats
         if results['multi_format_groups']:
-            click.echo(f"\nGroups with multiple formats: {results['multi_format_groups_total']}")
+            lines = [f"\nGroups with multiple formats: {results['multi_format_groups_total']}"]
             for group in results['multi_format_groups']:
                 extensions = ', '.join(group['extensions'])
-                click.echo(f"  {group['basename']}: {extensions}")
+                lines.append(f"  {group['basename']}: {extensions}")
             if len(results['multi_format_groups']) < results['multi_format_groups_total']:
                 remaining = results['multi_format_groups_total'] - len(results['multi_format_groups'])
-                click.echo(f"  ... and {remaining} more")
+                lines.append(f"  ... and {remaining} more")
+            click.echo('\n'.join(lines))
         
         click.echo(f"\n✅ Database successfully created!")
     
@@ -60,12 +68,13 @@ class PresentationService:
         click.echo(f"Destination: {results['destination']}")
         
         if results['dry_run']:
-            click.echo("\n🔍 DRY RUN - No files will be moved:")
+            lines = ["\n🔍 DRY RUN - No files will be moved:"]
             for op in results['operations']:
-                click.echo(f"  {op['source']} -> {op['action']} -> {op['destination']}")
+                lines.append(f"  {op['source']} -> {op['action']} -> {op['destination']}")
             if len(results['operations']) < results['total_files']:
                 remaining = results['total_files'] - len(results['operations'])
-                click.echo(f"  ... and {remaining} more files")
+                lines.append(f"  ... and {remaining} more files")
+            click.echo('\n'.join(lines))
         else:
             action_verb = "Copying" if results['copy_mode'] else "Renaming"
             success_verb = "copied" if results['copy_mode'] else "renamed"
@@ -136,21 +145,27 @@ class PresentationService:
             status_icon = '?'
             status_color = 'yellow'
 
-        click.echo(f"\nGroup: {group['basename']}")
-        click.echo(f"  Current filename: {group.get('current_filename', group['basename'])}")
-        click.echo(f"  Files: {', '.join(group['files'])}")
+        # Assemble the plain block once; only the colored status line needs
+        # its own secho call
+        lines = [
+            f"\nGroup: {group['basename']}",
+            f"  Current filename: {group.get('current_filename', group['basename'])}",
+            f"  Files: {', '.join(group['files'])}",
+        ]
 
         # Date sources
         if group['date_sources']:
-            click.echo(f"  Date Sources:")
+            lines.append("  Date Sources:")
             for source in group['date_sources']:
-                click.echo(f"    - {source['file']} ({source['source']}): {source['date']}")
+                lines.append(f"    - {source['file']} ({source['source']}): {source['date']}")
 
         # Comparison
-        click.echo(f"  Filename date: {group['filename_date'] or 'N/A'}")
-        click.echo(f"  Metadata date: {group['metadata_date'] or 'N/A'}")
+        lines.append(f"  Filename date: {group['filename_date'] or 'N/A'}")
+        lines.append(f"  Metadata date: {group['metadata_date'] or 'N/A'}")
         if group.get('metadata_datetime'):
-            click.echo(f"  Metadata datetime: {group['metadata_datetime']}")
+            lines.append(f"  Metadata datetime: {group['metadata_datetime']}")
+
+        click.echo('\n'.join(lines))
 
         # Status
         click.secho(f"  Status: {status_icon} {group['status']} - {group['message']}", fg=status_color)
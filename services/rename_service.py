@@ -1,18 +1,62 @@
 """Photo renaming service for file operations."""
 
 import logging
+import os
+import re
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from string import Formatter
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
+from dataclasses import dataclass
 from collections import defaultdict
 
 from models import PhotoGroupManager
 
 
+@dataclass(slots=True)
+class RenameOperation:
+    """A single pending file rename/copy, from candidate name to final path."""
+    group: Any
+    photo: Any
+    old_path: Path
+    base_new_path: str
+    base_filename: str
+    destination: Path
+    new_path: Optional[Path] = None
+    new_dir: Optional[Path] = None
+
+# Patterns used once per placeholder per photo; compiled at import so the
+# hot sanitization path never touches the re cache
+_PLACEHOLDER_RE = re.compile(r'\{([^}]+)\}')
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+
+# Single-char substitution is cheaper as a translate table than a regex walk
+_UNSAFE_CHARS_TABLE = str.maketrans({c: '_' for c in '<>:"|\\?*'})
+
+# Scheme placeholders that are filled from date metadata
+_DATE_FIELDS = frozenset({
+    'date', 'datetime', 'year', 'month', 'day', 'hour', 'minute', 'second'
+})
+
+# Scheme placeholders that require EXIF/XMP metadata extraction
+_METADATA_FIELDS = _DATE_FIELDS | frozenset({
+    'camera_make', 'camera_model', 'lens_model', 'serial_number',
+    'iso', 'aperture', 'focal_length', 'shutter_speed'
+})
+
+# Everything a naming scheme may reference
+_VALID_PLACEHOLDERS = _METADATA_FIELDS | frozenset({'basename', 'sequence'})
+
+
 class PhotoRenameService:
     """Service for renaming and organizing photo files."""
-    
+
+    # Seconds between progress log lines during long move/copy batches
+    PROGRESS_INTERVAL = 2.0
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
@@ -57,9 +101,10 @@ class PhotoRenameService:
         if not dry_run:
             destination.mkdir(parents=True, exist_ok=True)
         
-        # Validate the naming scheme
+        # Validate and compile the naming scheme once for the whole batch
         self._validate_naming_scheme(scheme)
-        
+        compiled_scheme = self._compile_scheme(scheme)
+
         # Determine which groups to process
         if skip_invalid:
             groups_to_process = manager.get_valid_groups()
@@ -70,7 +115,7 @@ class PhotoRenameService:
         
         # Generate rename operations
         rename_operations = self._generate_rename_operations(
-            groups_to_process, destination, scheme
+            groups_to_process, destination, compiled_scheme
         )
         
         # Apply sequence numbers to handle collisions
@@ -92,8 +137,8 @@ class PhotoRenameService:
             for op in rename_operations[:10]:  # Show first 10
                 action = "copied to" if copy_mode else "moved to"
                 results['operations'].append({
-                    'source': op['old_path'].name,
-                    'destination': op['new_path'].relative_to(destination),
+                    'source': op.old_path.name,
+                    'destination': op.new_path.relative_to(destination),
                     'action': action
                 })
         else:
@@ -114,143 +159,201 @@ class PhotoRenameService:
     
     def _validate_naming_scheme(self, scheme: str) -> None:
         """Validate that the naming scheme contains only valid placeholders."""
-        import re
-        
+        # An empty placeholder has no name for the regex to match, so catch
+        # it explicitly before it reaches the formatter
+        if '{}' in scheme:
+            raise ValueError("Empty placeholder '{}'")
+
         # Extract all placeholders from the scheme
-        placeholders = re.findall(r'\{([^}]+)\}', scheme)
-        
-        # Define valid placeholders
-        valid_placeholders = {
-            'date', 'datetime', 'year', 'month', 'day', 'hour', 'minute', 'second',
-            'camera_make', 'camera_model', 'lens_model', 'serial_number',
-            'iso', 'aperture', 'focal_length', 'shutter_speed',
-            'basename', 'sequence'
-        }
-        
+        placeholders = _PLACEHOLDER_RE.findall(scheme)
+
         # Check for invalid placeholders
-        invalid_placeholders = set(placeholders) - valid_placeholders
+        invalid_placeholders = set(placeholders) - _VALID_PLACEHOLDERS
         if invalid_placeholders:
             raise ValueError(f"Invalid placeholders: {', '.join(invalid_placeholders)}")
     
+    def _compile_scheme(self, scheme: str) -> Tuple[List, Set[str]]:
+        """
+        Compile a naming scheme into a token list plus the referenced fields.
+
+        The scheme is parsed once per rename batch instead of being re-scanned
+        by a chain of str.replace calls for every photo. Tokens are either
+        literal strings or 1-tuples holding a placeholder name.
+
+        Args:
+            scheme: Naming scheme with metadata placeholders
+
+        Returns:
+            Tuple of (tokens, referenced field names)
+        """
+        tokens: List = []
+        fields: Set[str] = set()
+
+        for literal, field_name, _spec, _conversion in Formatter().parse(scheme):
+            if literal:
+                tokens.append(literal)
+            if field_name is not None:
+                tokens.append((field_name,))
+                fields.add(field_name)
+
+        return tokens, fields
+
     def _generate_rename_operations(
-        self, 
-        groups: List, 
-        destination: Path, 
-        scheme: str
-    ) -> List[Dict[str, Any]]:
+        self,
+        groups: List,
+        destination: Path,
+        compiled_scheme: Tuple[List, Set[str]]
+    ) -> List[RenameOperation]:
         """Generate rename operations for all photos in the groups."""
         rename_operations = []
-        
+
+        # Schemes like "{basename}_{sequence}" never read metadata, so skip
+        # the EXIF/XMP extraction pass entirely in that case
+        needs_metadata = bool(compiled_scheme[1] & _METADATA_FIELDS)
+
+        # Work on plain strings in the per-photo loop; Path objects are only
+        # materialized once final paths are assigned
+        destination_str = os.fspath(destination)
+
+        fields = compiled_scheme[1]
+
         for group in groups:
-            # Extract metadata for the group
-            group_metadata = group.extract_metadata()
-            
+            # Extract metadata for the group and hoist its constant values
+            group_metadata = group.extract_metadata() if needs_metadata else None
+            group_values, needs_photo_dates = self._build_group_field_values(
+                fields, group_metadata
+            )
+
             # Process each photo in the group
             for photo in group.get_photos():
                 # Generate new name based on scheme and metadata
-                new_name = self._generate_base_filename(scheme, photo, group_metadata)
-                
+                new_name = self._generate_base_filename(
+                    compiled_scheme, photo, group_values, needs_photo_dates
+                )
+
                 # Calculate paths
                 old_path = photo.absolute_path
-                name_parts = new_name.split('/')
-                
-                if len(name_parts) > 1:
-                    # Has subdirectories
-                    subdir_path = Path(*name_parts[:-1])
-                    filename = name_parts[-1]
-                    base_new_path = destination / subdir_path / filename
-                else:
-                    # No subdirectories
-                    base_new_path = destination / new_name
-                
-                rename_operations.append({
-                    'group': group,
-                    'photo': photo,
-                    'old_path': old_path,
-                    'base_new_path': base_new_path,
-                    'base_filename': new_name,
-                    'destination': destination,
-                })
+                base_new_path = os.path.join(destination_str, *new_name.split('/'))
+
+                rename_operations.append(RenameOperation(
+                    group=group,
+                    photo=photo,
+                    old_path=old_path,
+                    base_new_path=base_new_path,
+                    base_filename=new_name,
+                    destination=destination,
+                ))
         
         return rename_operations
     
-    def _generate_base_filename(self, scheme: str, photo, group_metadata) -> str:
-        """Generate the base filename using the scheme and metadata."""
-        new_name = scheme
-        
-        # File modification time as fallback
-        mtime = datetime.fromtimestamp(photo.absolute_path.stat().st_mtime)
-        
-        # Date metadata
-        dates = group_metadata.dates if hasattr(group_metadata, 'dates') else None
-        camera = group_metadata.camera if hasattr(group_metadata, 'camera') else None
-        technical = group_metadata.technical if hasattr(group_metadata, 'technical') else None
-        
-        # Date/time replacements
-        if dates and dates.date_taken:
-            dt = dates.date_taken
-            replacements = {
-                '{date}': dt.strftime('%Y%m%d'),
-                '{datetime}': dt.strftime('%Y%m%d_%H%M%S'),
-                '{year}': dt.strftime('%Y'),
-                '{month}': dt.strftime('%m'),
-                '{day}': dt.strftime('%d'),
-                '{hour}': dt.strftime('%H'),
-                '{minute}': dt.strftime('%M'),
-                '{second}': dt.strftime('%S'),
-            }
-        else:
-            # Fallback to file modification time
-            replacements = {
-                '{date}': mtime.strftime('%Y%m%d'),
-                '{datetime}': mtime.strftime('%Y%m%d_%H%M%S'),
-                '{year}': mtime.strftime('%Y'),
-                '{month}': mtime.strftime('%m'),
-                '{day}': mtime.strftime('%d'),
-                '{hour}': mtime.strftime('%H'),
-                '{minute}': mtime.strftime('%M'),
-                '{second}': mtime.strftime('%S'),
-            }
-        
-        # Camera info replacements
-        if camera:
-            replacements.update({
-                '{camera_make}': self._safe_filename(camera.make or 'Unknown'),
-                '{camera_model}': self._safe_filename(camera.model or 'Unknown'),
-                '{lens_model}': self._safe_filename(camera.lens_model or 'Unknown'),
-                '{serial_number}': self._safe_filename(camera.serial_number or 'Unknown'),
-            })
-        else:
-            replacements.update({
-                '{camera_make}': 'Unknown',
-                '{camera_model}': 'Unknown',
-                '{lens_model}': 'Unknown',
-                '{serial_number}': 'Unknown',
-            })
-        
-        # Technical info replacements
-        if technical:
-            replacements.update({
-                '{iso}': str(technical.iso or 'Unknown'),
-                '{aperture}': f"f{technical.aperture}" if technical.aperture else 'Unknown',
-                '{focal_length}': f"{technical.focal_length}mm" if technical.focal_length else 'Unknown',
-                '{shutter_speed}': str(technical.shutter_speed or 'Unknown'),
-            })
+    def _build_group_field_values(
+        self, fields: Set[str], group_metadata
+    ) -> Tuple[Dict[str, str], bool]:
+        """
+        Build the placeholder values that are constant across a group.
+
+        Group metadata is shared by every photo in the group, so the strftime
+        and sanitization work happens once here instead of once per photo.
+        Only {basename}, {sequence} and the mtime date fallback vary per photo.
+
+        Args:
+            fields: Placeholder names referenced by the compiled scheme
+            group_metadata: The group's aggregated metadata (or None)
+
+        Returns:
+            Tuple of (values dict, whether date fields must be filled per photo)
+        """
+        values: Dict[str, str] = {}
+        needs_photo_dates = False
+
+        # Metadata objects always carry these attributes; only a missing
+        # metadata object itself needs guarding
+        if group_metadata is not None:
+            dates = group_metadata.dates
+            camera = group_metadata.camera
+            technical = group_metadata.technical
         else:
-            replacements.update({
-                '{iso}': 'Unknown',
-                '{aperture}': 'Unknown',
-                '{focal_length}': 'Unknown',
-                '{shutter_speed}': 'Unknown',
-            })
-        
-        # File info replacements
-        replacements['{basename}'] = photo.basename
-        
-        # Apply all replacements (skip sequence for now)
-        for placeholder, value in replacements.items():
-            new_name = new_name.replace(placeholder, str(value))
-        
+            dates = camera = technical = None
+
+        # Date/time values; without a metadata date each photo falls back to
+        # its own modification time, which can't be hoisted
+        if fields & _DATE_FIELDS:
+            if dates and dates.date_taken:
+                self._fill_date_values(values, fields, dates.date_taken)
+            else:
+                needs_photo_dates = True
+
+        # Camera info values
+        if 'camera_make' in fields:
+            values['camera_make'] = self._safe_filename(camera.make or 'Unknown') if camera else 'Unknown'
+        if 'camera_model' in fields:
+            values['camera_model'] = self._safe_filename(camera.model or 'Unknown') if camera else 'Unknown'
+        if 'lens_model' in fields:
+            values['lens_model'] = self._safe_filename(camera.lens_model or 'Unknown') if camera else 'Unknown'
+        if 'serial_number' in fields:
+            values['serial_number'] = self._safe_filename(camera.serial_number or 'Unknown') if camera else 'Unknown'
+
+        # Technical info values
+        if 'iso' in fields:
+            values['iso'] = str(technical.iso or 'Unknown') if technical else 'Unknown'
+        if 'aperture' in fields:
+            values['aperture'] = (f"f{technical.aperture}" if technical and technical.aperture
+                                  else 'Unknown')
+        if 'focal_length' in fields:
+            values['focal_length'] = (f"{technical.focal_length}mm" if technical and technical.focal_length
+                                      else 'Unknown')
+        if 'shutter_speed' in fields:
+            values['shutter_speed'] = str(technical.shutter_speed or 'Unknown') if technical else 'Unknown'
+
+        # {sequence} is left as a placeholder for the sequence-assignment pass
+        if 'sequence' in fields:
+            values['sequence'] = '{sequence}'
+
+        return values, needs_photo_dates
+
+    @staticmethod
+    def _fill_date_values(values: Dict[str, str], fields: Set[str], dt: datetime) -> None:
+        """Fill the referenced date placeholders from a single datetime."""
+        if 'date' in fields:
+            values['date'] = dt.strftime('%Y%m%d')
+        if 'datetime' in fields:
+            values['datetime'] = dt.strftime('%Y%m%d_%H%M%S')
+        if 'year' in fields:
+            values['year'] = dt.strftime('%Y')
+        if 'month' in fields:
+            values['month'] = dt.strftime('%m')
+        if 'day' in fields:
+            values['day'] = dt.strftime('%d')
+        if 'hour' in fields:
+            values['hour'] = dt.strftime('%H')
+        if 'minute' in fields:
+            values['minute'] = dt.strftime('%M')
+        if 'second' in fields:
+            values['second'] = dt.strftime('%S')
+
+    def _generate_base_filename(self, compiled_scheme: Tuple[List, Set[str]],
+                                photo, group_values: Dict[str, str],
+                                needs_photo_dates: bool) -> str:
+        """Generate the base filename using the compiled scheme and hoisted values."""
+        tokens, fields = compiled_scheme
+
+        values = group_values
+        if needs_photo_dates or 'basename' in fields:
+            values = dict(group_values)
+            if 'basename' in fields:
+                values['basename'] = photo.basename
+            if needs_photo_dates:
+                # Photo caches its stat result at construction, so the
+                # fallback costs no extra syscall per file
+                self._fill_date_values(
+                    values, fields, datetime.fromtimestamp(photo.mtime)
+                )
+
+        new_name = ''.join(
+            token if isinstance(token, str) else values[token[0]]
+            for token in tokens
+        )
+
         # Clean up the filename
         if '/' in new_name:
             parts = new_name.split('/')
@@ -258,42 +361,38 @@ class PhotoRenameService:
             new_name = '/'.join(clean_parts)
         else:
             new_name = self._safe_filename(new_name)
-        
+
         return new_name
     
     def _safe_filename(self, filename: str) -> str:
         """Make a string safe for use as a filename."""
-        import re
-        
         # Replace unsafe characters with underscores
-        safe_name = re.sub(r'[<>:"|\\?*]', '_', filename)
-        
+        safe_name = filename.translate(_UNSAFE_CHARS_TABLE)
+
         # Remove multiple consecutive underscores
-        safe_name = re.sub(r'_+', '_', safe_name)
-        
+        safe_name = _UNDERSCORE_RUN_RE.sub('_', safe_name)
+
         # Remove leading/trailing underscores and spaces
-        safe_name = safe_name.strip('_ ')
-        
-        return safe_name
+        return safe_name.strip('_ ')
     
-    def _apply_sequences_to_operations(self, rename_operations: List[Dict], sequence_digits: int) -> None:
+    def _apply_sequences_to_operations(self, rename_operations: List[RenameOperation], sequence_digits: int) -> None:
         """Apply sequence numbers to rename operations where needed."""
         # Check if any operation has {sequence} placeholder
-        has_sequence_placeholder = any('{sequence}' in op['base_filename'] for op in rename_operations)
+        has_sequence_placeholder = any('{sequence}' in op.base_filename for op in rename_operations)
         
         if has_sequence_placeholder:
             self._apply_explicit_sequences(rename_operations, sequence_digits)
         else:
             self._apply_collision_sequences(rename_operations, sequence_digits)
     
-    def _apply_explicit_sequences(self, rename_operations: List[Dict], sequence_digits: int) -> None:
+    def _apply_explicit_sequences(self, rename_operations: List[RenameOperation], sequence_digits: int) -> None:
         """Apply sequences for operations that have explicit {sequence} placeholders."""
         # Group operations by pattern and photo group
         pattern_to_groups = defaultdict(lambda: defaultdict(list))
         
         for operation in rename_operations:
-            base_filename = operation['base_filename']
-            original_group_basename = operation['group'].basename
+            base_filename = operation.base_filename
+            original_group_basename = operation.group.basename
             pattern_to_groups[base_filename][original_group_basename].append(operation)
         
         # Apply sequences to each pattern group
@@ -304,31 +403,29 @@ class PhotoRenameService:
                 operations = group_operations[group_name]
                 sequence_str = f"{seq_idx:0{sequence_digits}d}"
                 final_filename = pattern.replace('{sequence}', sequence_str)
-                
+                # Path components are the same for every operation in this
+                # batch; only the extension varies per photo
+                final_parts = final_filename.split('/')
+
                 for operation in operations:
-                    destination = operation['destination']
-                    name_parts = final_filename.split('/')
-                    
-                    if len(name_parts) > 1:
-                        subdir_path = Path(*name_parts[:-1])
-                        filename = name_parts[-1]
-                        final_path = destination / subdir_path / f"{filename}{operation['photo'].extension}"
-                    else:
-                        final_path = destination / f"{final_filename}{operation['photo'].extension}"
-                    
-                    operation['new_path'] = final_path
-                    operation['new_dir'] = final_path.parent
+                    destination = os.fspath(operation.destination)
+                    final_path = os.path.join(
+                        destination, *final_parts
+                    ) + operation.photo.extension
+
+                    operation.new_path = Path(final_path)
+                    operation.new_dir = Path(os.path.dirname(final_path))
     
-    def _apply_collision_sequences(self, rename_operations: List[Dict], sequence_digits: int) -> None:
+    def _apply_collision_sequences(self, rename_operations: List[RenameOperation], sequence_digits: int) -> None:
         """Apply sequences for operations that would collide."""
         # Group operations by base path and track original groups
         basename_to_groups = defaultdict(set)
         basename_to_operations = defaultdict(list)
         
         for operation in rename_operations:
-            base_path = str(operation['base_new_path'])
-            original_group_basename = operation['group'].basename
-            
+            base_path = operation.base_new_path
+            original_group_basename = operation.group.basename
+
             basename_to_groups[base_path].add(original_group_basename)
             basename_to_operations[base_path].append(operation)
         
@@ -344,86 +441,104 @@ class PhotoRenameService:
                 # Group by original photo group and assign same sequence
                 group_to_operations = defaultdict(list)
                 for operation in operations:
-                    original_group_basename = operation['group'].basename
+                    original_group_basename = operation.group.basename
                     group_to_operations[original_group_basename].append(operation)
                 
                 sorted_group_names = sorted(group_to_operations.keys())
                 
                 for seq_idx, group_name in enumerate(sorted_group_names, 1):
                     group_operations = group_to_operations[group_name]
-                    
+                    sequence_str = f"_{seq_idx:0{sequence_digits}d}"
+
                     for operation in group_operations:
-                        base_path_obj = operation['base_new_path']
-                        extension = operation['photo'].extension
-                        sequence_str = f"_{seq_idx:0{sequence_digits}d}"
-                        final_path = Path(f"{base_path_obj}{sequence_str}{extension}")
-                        
-                        operation['new_path'] = final_path
-                        operation['new_dir'] = final_path.parent
+                        extension = operation.photo.extension
+                        final_path = f"{operation.base_new_path}{sequence_str}{extension}"
+
+                        operation.new_path = Path(final_path)
+                        operation.new_dir = Path(os.path.dirname(final_path))
             else:
                 # No conflicts - use as-is
                 for operation in operations:
-                    base_path_obj = operation['base_new_path']
-                    extension = operation['photo'].extension
-                    final_path = Path(f"{base_path_obj}{extension}")
-                    
-                    operation['new_path'] = final_path
-                    operation['new_dir'] = final_path.parent
+                    extension = operation.photo.extension
+                    final_path = f"{operation.base_new_path}{extension}"
+
+                    operation.new_path = Path(final_path)
+                    operation.new_dir = Path(os.path.dirname(final_path))
     
-    def _execute_rename_operations(self, rename_operations: List[Dict], copy_mode: bool) -> int:
+    def _execute_rename_operations(self, rename_operations: List[RenameOperation], copy_mode: bool) -> int:
         """Execute the actual file rename/copy operations."""
-        processed_count = 0
+        total = len(rename_operations)
         action_verb = "Copying" if copy_mode else "Renaming"
-        
-        for op in rename_operations:
+
+        # Create each target directory exactly once up front; many operations
+        # share the same destination directory. Shallowest first, so deeper
+        # directories find their parents already created.
+        for new_dir in sorted({op.new_dir for op in rename_operations},
+                              key=lambda p: len(p.parts)):
+            new_dir.mkdir(parents=True, exist_ok=True)
+
+        # One timestamp for the whole batch; the history entries record the
+        # operation, not the per-file microsecond
+        batch_timestamp = datetime.now().isoformat()
+
+        def process(op: RenameOperation) -> int:
             try:
-                # Create directory if needed
-                op['new_dir'].mkdir(parents=True, exist_ok=True)
-                
-                # Copy or move the file
                 if copy_mode:
-                    shutil.copy2(str(op['old_path']), str(op['new_path']))
-                    self._add_copy_history(op['photo'], op['old_path'], op['new_path'])
+                    shutil.copy2(str(op.old_path), str(op.new_path))
+                    self._add_copy_history(op.photo, op.old_path, op.new_path, batch_timestamp)
                 else:
-                    shutil.move(str(op['old_path']), str(op['new_path']))
-                    self._update_photo_with_history(op['photo'], op['old_path'], op['new_path'])
-                
-                processed_count += 1
-                
-                if processed_count % 100 == 0:
-                    self.logger.info(f"{action_verb} {processed_count}/{len(rename_operations)} files...")
-                    
+                    try:
+                        # Single rename syscall on the same filesystem
+                        os.replace(op.old_path, op.new_path)
+                    except OSError:
+                        # Cross-device move needs the copy+unlink fallback
+                        shutil.move(str(op.old_path), str(op.new_path))
+                    self._update_photo_with_history(op.photo, op.old_path, op.new_path, batch_timestamp)
+                return 1
             except Exception as e:
-                self.logger.error(f"Failed to {action_verb.lower()} {op['old_path']} -> {op['new_path']}: {e}")
-        
+                self.logger.error("Failed to %s %s -> %s: %s", action_verb.lower(), op.old_path, op.new_path, e)
+                return 0
+
+        processed_count = 0
+        # Rate-limit progress by wall clock rather than file count so fast
+        # moves don't pay for a log call every N iterations
+        next_report = time.monotonic() + self.PROGRESS_INTERVAL
+
+        if total > 1:
+            # The operations are syscall-bound and independent, so spread them
+            # over threads; the kernel releases the GIL during each call
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+                for done in executor.map(process, rename_operations):
+                    processed_count += done
+
+                    if time.monotonic() >= next_report:
+                        self.logger.info("%s %d/%d files...", action_verb, processed_count, total)
+                        next_report = time.monotonic() + self.PROGRESS_INTERVAL
+        else:
+            for op in rename_operations:
+                processed_count += process(op)
+
         return processed_count
     
-    def _update_photo_with_history(self, photo, old_path: Path, new_path: Path) -> None:
+    def _update_photo_with_history(self, photo, old_path: Path, new_path: Path,
+                                   timestamp: str) -> None:
         """Update photo object with new path and add history entry."""
-        # Add history entry if not already present
-        if not hasattr(photo, 'history'):
-            photo.history = []
-        
-        # Add the old location to history
+        # Photo always initializes history, so no attribute probe is needed
         photo.history.append({
-            'path': str(old_path),
-            'timestamp': datetime.now().isoformat(),
+            'path': os.fspath(old_path),
+            'timestamp': timestamp,
             'operation': 'rename'
         })
-        
+
         # Update the photo's path
         photo.absolute_path = new_path
-    
-    def _add_copy_history(self, photo, old_path: Path, new_path: Path) -> None:
+
+    def _add_copy_history(self, photo, old_path: Path, new_path: Path,
+                          timestamp: str) -> None:
         """Add copy history entry to photo object without updating the path."""
-        # Add history entry if not already present
-        if not hasattr(photo, 'history'):
-            photo.history = []
-        
-        # Add the copy operation to history
         photo.history.append({
-            'original_path': str(old_path),
-            'copied_to': str(new_path),
-            'timestamp': datetime.now().isoformat(),
+            'original_path': os.fspath(old_path),
+            'copied_to': os.fspath(new_path),
+            'timestamp': timestamp,
             'operation': 'copy'
         })
@@ -1,7 +1,6 @@
 """Validation service for checking photo file naming against metadata dates."""
 
 import logging
-import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
@@ -130,21 +129,33 @@ class ValidationService:
         if metadata.dates and metadata.dates.date_taken:
             metadata_date = metadata.dates.date_taken
 
+        # Pack both dates into yyyymmdd integers once; the comparison and the
+        # report strings below reuse them instead of re-walking datetime
+        filename_int = self._pack_date(filename_date)
+        metadata_int = self._pack_date(metadata_date)
+
         # Compare dates
-        status, message = self._compare_dates(filename_date, metadata_date)
+        status, message = self._compare_dates(filename_int, metadata_int)
 
         return {
             'basename': group.basename,
             'current_filename': current_filename,
             'files': [p.filename for p in photos],
             'date_sources': date_sources,
-            'filename_date': filename_date.strftime('%Y%m%d') if filename_date else None,
-            'metadata_date': metadata_date.strftime('%Y%m%d') if metadata_date else None,
+            'filename_date': f"{filename_int:08d}" if filename_int else None,
+            'metadata_date': f"{metadata_int:08d}" if metadata_int else None,
             'metadata_datetime': metadata_date.isoformat() if metadata_date else None,
             'status': status,
             'message': message
         }
 
+    @staticmethod
+    def _pack_date(dt: Optional[datetime]) -> Optional[int]:
+        """Pack a datetime's date portion into a yyyymmdd integer."""
+        if dt is None:
+            return None
+        return dt.year * 10000 + dt.month * 100 + dt.day
+
     def _extract_date_from_filename(self, filename: str) -> Optional[datetime]:
         """
         Extract date from a filename.
@@ -157,16 +168,12 @@ class ValidationService:
         Returns:
             datetime if date found, None otherwise
         """
-        # Pattern for YYYYMMDD at the start of filename
-        pattern = r'^(\d{4})(\d{2})(\d{2})'
-        match = re.match(pattern, filename)
-
-        if match:
+        # Fixed-width YYYYMMDD prefix: a digit-slice check avoids the regex
+        # engine entirely on this per-file hot path
+        prefix = filename[:8]
+        if len(prefix) == 8 and prefix.isdigit():
             try:
-                year = int(match.group(1))
-                month = int(match.group(2))
-                day = int(match.group(3))
-                return datetime(year, month, day)
+                return datetime(int(prefix[:4]), int(prefix[4:6]), int(prefix[6:8]))
             except ValueError:
                 return None
 
@@ -187,7 +194,7 @@ class ValidationService:
         for photo in group.get_photos():
             # Get file modification time
             try:
-                mtime = datetime.fromtimestamp(photo.absolute_path.stat().st_mtime)
+                mtime = datetime.fromtimestamp(photo.mtime)
                 date_sources.append({
                     'file': photo.filename,
                     'source': 'File mtime',
@@ -230,15 +237,15 @@ class ValidationService:
 
     def _compare_dates(
         self,
-        filename_date: Optional[datetime],
-        metadata_date: Optional[datetime]
+        filename_date: Optional[int],
+        metadata_date: Optional[int]
     ) -> tuple:
         """
         Compare filename date with metadata date.
 
         Args:
-            filename_date: Date extracted from filename
-            metadata_date: Date from metadata
+            filename_date: Date extracted from filename, packed as yyyymmdd
+            metadata_date: Date from metadata, packed as yyyymmdd
 
         Returns:
             Tuple of (status, message)
@@ -249,8 +256,8 @@ class ValidationService:
         if metadata_date is None:
             return ('UNKNOWN', 'No metadata date available')
 
-        # Compare just the date portion (ignore time)
-        if filename_date.date() == metadata_date.date():
+        # Packed integers already ignore the time portion
+        if filename_date == metadata_date:
             return ('OK', 'Filename date matches metadata')
         else:
-            return ('MISMATCH', f'Filename has {filename_date.strftime("%Y%m%d")} but metadata has {metadata_date.strftime("%Y%m%d")}')
+            return ('MISMATCH', f'Filename has {filename_date:08d} but metadata has {metadata_date:08d}')
@@ -0,0 +1,151 @@
+import unittest
+import tempfile
+import os
+import shutil
+from unittest.mock import patch
+
+from models.photo_group import fast_walk, fast_walk_parallel
+
+
+class TestFastWalk(unittest.TestCase):
+    """Test cases for the fast_walk directory walkers."""
+
+    def setUp(self):
+        """Set up a small directory tree with nested photo files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.create_file("top.jpg")
+        self.create_file("top.cr2")
+        self.create_file("notes.txt")
+        os.makedirs(os.path.join(self.temp_dir, "sub", "deeper"))
+        self.create_file(os.path.join("sub", "nested.jpg"))
+        self.create_file(os.path.join("sub", "nested.xmp"))
+        self.create_file(os.path.join("sub", "deeper", "deep.heic"))
+        os.symlink(
+            os.path.join(self.temp_dir, "sub", "nested.jpg"),
+            os.path.join(self.temp_dir, "link.jpg")
+        )
+
+    def tearDown(self):
+        """Clean up after tests."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def create_file(self, relative_path: str) -> None:
+        """Create an empty file under the temp directory."""
+        with open(os.path.join(self.temp_dir, relative_path), 'w') as f:
+            f.write("test")
+
+    def collect_names(self, walker_results) -> set:
+        """Collect the file names from walker (path, name) tuples."""
+        return {name for _path, name in walker_results}
+
+    def test_recursive_walk_finds_all_files(self):
+        """Test that the recursive walk reaches every nesting level."""
+        names = self.collect_names(fast_walk(self.temp_dir))
+        self.assertEqual(names, {
+            "top.jpg", "top.cr2", "notes.txt",
+            "nested.jpg", "nested.xmp", "deep.heic"
+        })
+
+    def test_non_recursive_walk_stays_at_top_level(self):
+        """Test that recursive=False only yields top-level files."""
+        names = self.collect_names(fast_walk(self.temp_dir, recursive=False))
+        self.assertEqual(names, {"top.jpg", "top.cr2", "notes.txt"})
+
+    def test_extension_filter(self):
+        """Test that the extension filter drops non-matching files."""
+        names = self.collect_names(
+            fast_walk(self.temp_dir, extensions={'.jpg', '.heic'})
+        )
+        self.assertEqual(names, {"top.jpg", "nested.jpg", "deep.heic"})
+
+    def test_yielded_paths_point_at_real_files(self):
+        """Test that yielded paths are usable as-is."""
+        for path, name in fast_walk(self.temp_dir):
+            self.assertTrue(os.path.isfile(path))
+            self.assertEqual(os.path.basename(path), name)
+
+    def test_scandir_branch_matches_fwalk_branch(self):
+        """Test that the scandir fallback yields the same files as fwalk."""
+        fwalk_names = self.collect_names(fast_walk(self.temp_dir))
+        with patch('models.photo_group.hasattr', create=True) as mock_hasattr:
+            mock_hasattr.return_value = False
+            scandir_names = self.collect_names(fast_walk(self.temp_dir))
+        self.assertEqual(scandir_names, fwalk_names)
+
+    def test_symlinked_files_are_skipped_by_all_walkers(self):
+        """Test that no walker yields the symlinked photo."""
+        for walker_results in (
+            fast_walk(self.temp_dir),
+            fast_walk(self.temp_dir, recursive=False),
+            fast_walk_parallel(self.temp_dir)
+        ):
+            self.assertNotIn("link.jpg", self.collect_names(walker_results))
+
+    def test_missing_root_raises(self):
+        """Test that a nonexistent root raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            list(fast_walk(os.path.join(self.temp_dir, "nope")))
+
+    def test_file_root_raises(self):
+        """Test that a file path as root raises NotADirectoryError."""
+        with self.assertRaises(NotADirectoryError):
+            list(fast_walk(os.path.join(self.temp_dir, "top.jpg")))
+
+
+class TestFastWalkParallel(unittest.TestCase):
+    """Test cases for the threaded fast_walk_parallel walker."""
+
+    def setUp(self):
+        """Set up a directory tree wide and deep enough to span workers."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.expected = set()
+        for sub in range(4):
+            subdir = os.path.join(self.temp_dir, f"dir{sub}", "inner")
+            os.makedirs(subdir)
+            for idx in range(3):
+                name = f"photo_{sub}_{idx}.jpg"
+                with open(os.path.join(subdir, name), 'w') as f:
+                    f.write("test")
+                self.expected.add(name)
+        with open(os.path.join(self.temp_dir, "root.cr2"), 'w') as f:
+            f.write("test")
+        self.expected.add("root.cr2")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_parallel_walk_matches_sequential_walk(self):
+        """Test that the parallel walk finds exactly the sequential set."""
+        sequential = {name for _p, name in fast_walk(self.temp_dir)}
+        for workers in (1, 4):
+            parallel = {
+                name for _p, name in
+                fast_walk_parallel(self.temp_dir, max_workers=workers)
+            }
+            self.assertEqual(parallel, sequential)
+            self.assertEqual(parallel, self.expected)
+
+    def test_parallel_walk_extension_filter(self):
+        """Test that the extension filter applies in worker threads."""
+        names = {
+            name for _p, name in
+            fast_walk_parallel(self.temp_dir, extensions={'.cr2'}, max_workers=4)
+        }
+        self.assertEqual(names, {"root.cr2"})
+
+    def test_parallel_walk_missing_root_raises(self):
+        """Test that a nonexistent root raises in the caller's thread."""
+        with self.assertRaises(FileNotFoundError):
+            list(fast_walk_parallel(os.path.join(self.temp_dir, "nope")))
+
+    def test_parallel_walk_file_root_raises(self):
+        """Test that a file path as root raises NotADirectoryError."""
+        with self.assertRaises(NotADirectoryError):
+            list(fast_walk_parallel(os.path.join(self.temp_dir, "root.cr2")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import tempfile
+import os
+import shutil
+
+from models.metadata import (
+    MetadataCache, PhotoMetadata, CameraInfo, DateInfo, TechnicalInfo
+)
+
+
+class TestMetadataCache(unittest.TestCase):
+    """Test cases for the persistent sqlite metadata cache."""
+
+    def setUp(self):
+        """Set up a cache backed by a temp database file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "metadata.db")
+        self.cache = MetadataCache(self.db_path)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.cache.close()
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def make_metadata(self, camera_make: str = "Canon") -> PhotoMetadata:
+        """Create a small non-empty PhotoMetadata object."""
+        metadata = PhotoMetadata(
+            camera=CameraInfo(), dates=DateInfo(), technical=TechnicalInfo()
+        )
+        metadata.camera.make = camera_make
+        metadata.camera.model = "EOS R5"
+        metadata.technical.iso = 400
+        return metadata
+
+    def test_get_on_empty_cache_misses(self):
+        """Test that an unknown key returns None."""
+        self.assertIsNone(self.cache.get("/photos/a.jpg", 1000, 2048))
+
+    def test_put_then_get_round_trip(self):
+        """Test that stored metadata is returned intact for the same key."""
+        metadata = self.make_metadata()
+        self.cache.put("/photos/a.jpg", 1000, 2048, metadata)
+
+        cached = self.cache.get("/photos/a.jpg", 1000, 2048)
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.camera.make, "Canon")
+        self.assertEqual(cached.camera.model, "EOS R5")
+        self.assertEqual(cached.technical.iso, 400)
+
+    def test_changed_file_identity_misses(self):
+        """Test that a different mtime or size is treated as a miss."""
+        self.cache.put("/photos/a.jpg", 1000, 2048, self.make_metadata())
+
+        self.assertIsNone(self.cache.get("/photos/a.jpg", 2000, 2048))
+        self.assertIsNone(self.cache.get("/photos/a.jpg", 1000, 4096))
+
+    def test_put_replaces_stale_entry_for_same_path(self):
+        """Test that re-caching a path drops the entry for the old version."""
+        self.cache.put("/photos/a.jpg", 1000, 2048, self.make_metadata("Canon"))
+        self.cache.put("/photos/a.jpg", 2000, 2048, self.make_metadata("Nikon"))
+
+        # The old file identity is gone, the new one is served
+        self.assertIsNone(self.cache.get("/photos/a.jpg", 1000, 2048))
+        cached = self.cache.get("/photos/a.jpg", 2000, 2048)
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.camera.make, "Nikon")
+
+    def test_entries_persist_across_instances(self):
+        """Test that a new cache instance sees entries written by a closed one."""
+        self.cache.put("/photos/a.jpg", 1000, 2048, self.make_metadata())
+        self.cache.close()
+
+        self.cache = MetadataCache(self.db_path)
+        cached = self.cache.get("/photos/a.jpg", 1000, 2048)
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.camera.make, "Canon")
+
+
+if __name__ == '__main__':
+    unittest.main()
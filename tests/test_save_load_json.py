@@ -0,0 +1,110 @@
+import unittest
+import tempfile
+import os
+import json
+import shutil
+from pathlib import Path
+
+from models import PhotoGroupManager
+from models.photo import Photo
+
+
+class TestSaveLoadJson(unittest.TestCase):
+    """Test cases for the streaming JSON writer and loader round trip."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_file = os.path.join(self.temp_dir, "database.json")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def create_manager_with_photos(self, filenames: list) -> PhotoGroupManager:
+        """Create photo files on disk and a manager containing them."""
+        manager = PhotoGroupManager()
+        for filename in filenames:
+            file_path = os.path.join(self.temp_dir, filename)
+            with open(file_path, 'w') as f:
+                f.write("test photo content")
+            manager.add_photo(Photo(file_path))
+        return manager
+
+    def test_round_trip_preserves_groups_and_photos(self):
+        """Test that save followed by load restores groups and photos."""
+        manager = self.create_manager_with_photos([
+            "vacation.jpg", "vacation.cr2", "vacation.xmp",
+            "portrait.heic", "landscape.png"
+        ])
+
+        manager.save_to_json(self.output_file)
+        loaded = PhotoGroupManager.load_from_json(Path(self.output_file))
+
+        self.assertEqual(loaded.total_groups, manager.total_groups)
+        self.assertEqual(loaded.total_photos, manager.total_photos)
+        self.assertEqual(loaded.get_basenames(), manager.get_basenames())
+
+        for basename in manager.get_basenames():
+            original = manager.get_group(basename)
+            restored = loaded.get_group(basename)
+            self.assertIsNotNone(restored)
+            self.assertEqual(restored.get_extensions(), original.get_extensions())
+            self.assertEqual(
+                sorted(p.filename for p in restored.get_photos()),
+                sorted(p.filename for p in original.get_photos())
+            )
+
+    def test_saved_file_is_valid_json(self):
+        """Test that the hand-assembled output parses with the stdlib parser."""
+        manager = self.create_manager_with_photos(["vacation.jpg", "vacation.cr2"])
+
+        manager.save_to_json(self.output_file)
+
+        with open(self.output_file, 'r') as f:
+            data = json.load(f)
+
+        self.assertIn("metadata", data)
+        self.assertIn("groups", data)
+        self.assertEqual(data["metadata"]["total_groups"], 1)
+        self.assertEqual(data["metadata"]["total_photos"], 2)
+        self.assertIn("vacation", data["groups"])
+        self.assertEqual(data["groups"]["vacation"]["count"], 2)
+
+    def test_round_trip_with_no_groups(self):
+        """Test that an empty manager saves and loads cleanly."""
+        manager = PhotoGroupManager()
+
+        manager.save_to_json(self.output_file)
+
+        with open(self.output_file, 'r') as f:
+            data = json.load(f)
+        self.assertEqual(data["groups"], {})
+        self.assertEqual(data["metadata"]["total_groups"], 0)
+
+        loaded = PhotoGroupManager.load_from_json(Path(self.output_file))
+        self.assertEqual(loaded.total_groups, 0)
+        self.assertEqual(loaded.total_photos, 0)
+
+    def test_round_trip_with_special_character_basenames(self):
+        """Test basenames needing JSON escaping survive the round trip."""
+        manager = self.create_manager_with_photos([
+            'quo"ted.jpg',
+            "spaced out café.jpg",
+            "back\\slash.jpg"
+        ])
+
+        manager.save_to_json(self.output_file)
+
+        # The file must still be valid JSON despite the escapes
+        with open(self.output_file, 'r') as f:
+            json.load(f)
+
+        loaded = PhotoGroupManager.load_from_json(Path(self.output_file))
+        self.assertEqual(loaded.get_basenames(), manager.get_basenames())
+        self.assertEqual(loaded.total_photos, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()